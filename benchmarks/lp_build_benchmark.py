@@ -0,0 +1,73 @@
+# Build time of the LP model versus problem size.
+#
+# Compares the former cell-by-cell construction (one `+=` per coefficient, zeros
+# included) with `lp_build_model` on dense and sparse constraint matrices.
+#
+# Usage: python -m benchmarks.lp_build_benchmark
+
+import time
+
+import numpy as np
+from pulp import LpProblem, LpMaximize, LpVariable, LpAffineExpression
+from scipy import sparse
+
+from core.linear_programmation import lp_build_model
+
+SIZES = [(50, 50), (200, 200), (500, 500), (1000, 1000)]
+DENSITY = 0.05
+
+def legacy_build_model(
+    decision_vars: list[str],
+    decision_vars_coef: list[float],
+    constraintes_coef: list[list[float]],
+    constraintes_inequality: list[float]
+) -> LpProblem:
+    lp_prob = LpProblem("lp_problem", LpMaximize)
+
+    decision_variables: dict[str, LpVariable] = dict()
+    for i in range(len(decision_vars)):
+        decision_variables.update({f"x{i+1}": LpVariable(decision_vars[i], lowBound=0)})
+
+    objective_func = LpAffineExpression()
+    for index in range(len(decision_vars)):
+        objective_func += decision_vars_coef[index] * decision_variables[f"x{index+1}"]
+    lp_prob += objective_func
+
+    for i in range(len(constraintes_coef)):
+        constrainte = LpAffineExpression()
+        for j in range(len(decision_vars)):
+            constrainte += constraintes_coef[i][j] * decision_variables[f"x{j+1}"]
+        lp_prob += constrainte <= constraintes_inequality[i]
+
+    return lp_prob
+
+def timed(function, *args) -> float:
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+
+    print(f"{'constraints':>11} {'variables':>9} {'nonzeros':>9} {'legacy (s)':>11} {'dense (s)':>10} {'sparse (s)':>11}")
+    for n_constraints, n_vars in SIZES:
+        constraint_matrix = sparse.random(n_constraints, n_vars, density=DENSITY, format="csr", random_state=rng)
+        dense_matrix = constraint_matrix.toarray()
+        objective_coef = rng.uniform(1, 10, n_vars)
+        constraint_bounds = rng.uniform(10, 100, n_constraints)
+        decision_vars = [f"x{j+1}" for j in range(n_vars)]
+
+        legacy_time = timed(
+            legacy_build_model,
+            decision_vars, objective_coef.tolist(), dense_matrix.tolist(), constraint_bounds.tolist()
+        )
+        dense_time = timed(lp_build_model, decision_vars, objective_coef, dense_matrix, constraint_bounds, True)
+        sparse_time = timed(lp_build_model, decision_vars, objective_coef, constraint_matrix, constraint_bounds, True)
+
+        print(
+            f"{n_constraints:>11} {n_vars:>9} {constraint_matrix.nnz:>9} "
+            f"{legacy_time:>11.3f} {dense_time:>10.3f} {sparse_time:>11.3f}"
+        )
+
+if __name__ == "__main__":
+    main()
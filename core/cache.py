@@ -0,0 +1,258 @@
+from collections import OrderedDict
+from typing import Any, Callable
+import pickle
+import sqlite3
+import threading
+import time
+
+class LRUCache:
+    # Least recently used cache bounded by the total size (in bytes) of its entries.
+    # Module level caches are shared by every session thread: each operation holds a lock.
+
+    def __init__(
+        self,
+        max_bytes: int,
+        sizeof: Callable[[Any], int],
+        expired: Callable[[Any], bool] | None = None
+    ) -> None:
+        if max_bytes <= 0:
+            raise ValueError("The cache size must be a positive number of bytes.")
+
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self.expired = expired
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[str, tuple[Any, int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def get(self, key: str) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+
+            # An expired entry is dropped and counted as a miss
+            if entry is not None and self.expired is not None and self.expired(entry[0]):
+                del self._entries[key]
+                self.current_bytes -= entry[1]
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            # Mark the entry as the most recently used
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+            return entry[0]
+
+    def put(self, key: str, value: Any) -> None:
+        # Sized outside the lock: sizeof may be slow
+        size = self.sizeof(value)
+
+        # An entry bigger than the whole cache is never stored
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self.current_bytes -= self._entries.pop(key)[1]
+
+            self._entries[key] = (value, size)
+            self.current_bytes += size
+
+            self._evict()
+
+    def resize(self, max_bytes: int) -> None:
+        if max_bytes <= 0:
+            raise ValueError("The cache size must be a positive number of bytes.")
+
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def _evict(self) -> None:
+        # Evict the least recently used entries until the cache fits in memory (lock held)
+        while self.current_bytes > self.max_bytes:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self.current_bytes -= evicted_size
+            self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self.current_bytes,
+                "max_bytes": self.max_bytes
+            }
+
+
+class SQLiteCache:
+    # On-disk cache shared between processes: pickled values in a SQLite table,
+    # evicted by least recent access once the total size exceeds max_bytes, and
+    # expired after ttl seconds (if given)
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int,
+        ttl: float | None = None
+    ) -> None:
+        if max_bytes <= 0:
+            raise ValueError("The cache size must be a positive number of bytes.")
+
+        self.path = path
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        with self._connect() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, "
+                "created REAL NOT NULL, accessed REAL NOT NULL)"
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)")
+
+    def _connect(self) -> sqlite3.Connection:
+        # One short-lived connection per operation: safe across threads and processes
+        return sqlite3.connect(self.path, timeout=30)
+
+    def get(self, key: str) -> Any | None:
+        now = time.time()
+
+        with self._connect() as connection:
+            row = connection.execute("SELECT value, created FROM entries WHERE key = ?", (key,)).fetchone()
+
+            if row is not None and self.ttl is not None and now - row[1] > self.ttl:
+                connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+                row = None
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            connection.execute("UPDATE entries SET accessed = ? WHERE key = ?", (now, key))
+
+        self.hits += 1
+        return pickle.loads(row[0])
+
+    def put(self, key: str, value: Any) -> None:
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(blob) > self.max_bytes:
+            return
+
+        now = time.time()
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO entries (key, value, size, created, accessed) VALUES (?, ?, ?, ?, ?)",
+                (key, blob, len(blob), now, now)
+            )
+
+            if self.ttl is not None:
+                connection.execute("DELETE FROM entries WHERE created < ?", (now - self.ttl,))
+
+            # Evict the least recently accessed entries until the cache fits on disk
+            total_bytes = connection.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+            if total_bytes > self.max_bytes:
+                evicted = []
+                for evicted_key, size in connection.execute("SELECT key, size FROM entries ORDER BY accessed"):
+                    if total_bytes <= self.max_bytes:
+                        break
+                    evicted.append((evicted_key,))
+                    total_bytes -= size
+                connection.executemany("DELETE FROM entries WHERE key = ?", evicted)
+                self.evictions += len(evicted)
+
+    def clear(self) -> None:
+        with self._connect() as connection:
+            connection.execute("DELETE FROM entries")
+
+    def stats(self) -> dict[str, int]:
+        with self._connect() as connection:
+            entries, total_bytes = connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()
+
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": entries,
+            "bytes": total_bytes,
+            "max_bytes": self.max_bytes
+        }
+
+
+class TieredCache:
+    # In-memory LRU tier in front of an optional on-disk SQLite tier
+
+    def __init__(
+        self,
+        memory_bytes: int,
+        sizeof: Callable[[Any], int],
+        disk: SQLiteCache | None = None,
+        ttl: float | None = None
+    ) -> None:
+        # Memory entries are (insertion time, value) pairs so that they expire like the disk ones
+        self.memory = LRUCache(
+            memory_bytes,
+            lambda entry: sizeof(entry[1]),
+            expired=None if ttl is None else lambda entry: time.time() - entry[0] > ttl
+        )
+        self.disk = disk
+        self.ttl = ttl
+
+    def get(self, key: str) -> Any | None:
+        entry = self.memory.get(key)
+
+        if entry is not None:
+            return entry[1]
+
+        if self.disk is None:
+            return None
+
+        value = self.disk.get(key)
+        if value is not None:
+            # Promote the entry to the memory tier
+            self.memory.put(key, (time.time(), value))
+
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        self.memory.put(key, (time.time(), value))
+
+        if self.disk is not None:
+            self.disk.put(key, value)
+
+    def clear(self) -> None:
+        self.memory.clear()
+
+        if self.disk is not None:
+            self.disk.clear()
+
+    def stats(self) -> dict[str, dict[str, int] | None]:
+        return {
+            "memory": self.memory.stats(),
+            "disk": self.disk.stats() if self.disk is not None else None
+        }
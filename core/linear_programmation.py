@@ -1,98 +1,1250 @@
-from pulp import LpProblem, LpMaximize, LpMinimize, LpVariable, LpStatus, value, LpAffineExpression
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
+import io
+import os
+import re
+import tempfile
+import time
+
+from pulp import LpProblem, LpMaximize, LpMinimize, LpVariable, LpStatus, LpSolution, value, LpAffineExpression, LpConstraint, LpConstraintLE, PULP_CBC_CMD
+from pulp import LpSolutionOptimal, LpSolutionIntegerFeasible, LpSolutionNoSolutionFound
+from pulp.pulp import LpElement
+from scipy import linalg, optimize, sparse
+from scipy.sparse import linalg as sparse_linalg
+import numpy as np
 import pandas as pd
 
+from core.cache import SQLiteCache, TieredCache
+
+def _lp_read_csv(source, engine: str = "pyarrow", **kwargs) -> pd.DataFrame:
+    # Columnar multi-threaded parsing with pyarrow; it rejects ragged rows (such as a
+    # resources row without objective value), which the C engine accepts
+    try:
+        return pd.read_csv(source, engine=engine, **kwargs)
+    except pd.errors.ParserError:
+        if engine == "c":
+            raise
+        if hasattr(source, "seek"):
+            source.seek(0)
+        return pd.read_csv(source, engine="c", **kwargs)
+
+
 def lp_extract_data_from_csv(
     path: str,
     objective_col: str,
-    decision_var_col: str
-) -> dict[str, list]:
-    # Load csv data
-    data_frame = pd.read_csv(path)
-    data_frame_without_last_row = data_frame.iloc[:-1, :]  # Ignore the last row (ressouces row)
+    decision_var_col: str,
+    engine: str = "pyarrow"
+) -> dict[str, list | np.ndarray]:
+    # The resources row (the last one) has no objective value: a ragged row that pyarrow
+    # rejects. The products rows and the resources row are parsed separately, so the
+    # columnar reader applies to the body.
+    with open(path, "rb") as csv_file:
+        content = csv_file.read()
+    header = content[:content.find(b"\n") + 1]
+    body_end = content.rstrip(b"\r\n").rfind(b"\n") + 1
 
-    # Get decision variables
-    decision_vars: list[str] = data_frame_without_last_row[decision_var_col].tolist()
-
-    # Get decision variables coefficients
-    decision_vars_coef: list[float] = data_frame_without_last_row[objective_col].tolist()
+    data_frame = _lp_read_csv(io.BytesIO(content[:body_end]), engine=engine)
+    ressources_row = pd.read_csv(io.BytesIO(header + content[body_end:]), engine="c")
 
     # Get resource headers (exclude decision_var_col and to_maximize)
     exclude_columns = {decision_var_col, objective_col}
     ressources_headers: list[str] = [col for col in data_frame.columns if col not in exclude_columns]
 
+    # Get decision variables
+    decision_vars: list[str] = data_frame[decision_var_col].astype(str).tolist()
+
+    # Numeric blocks go straight from the columns to ndarrays
+    decision_vars_coef = data_frame[objective_col].to_numpy(dtype=float)
+
     # Get constraints coefficients (organized by resource, not by product)
-    constraintes_coef: list[list[float]] = [[] for _ in range(len(ressources_headers))]
-    for ressource_index, ressource_header in enumerate(ressources_headers):
-        for value in data_frame_without_last_row[ressource_header]:
-            constraintes_coef[ressource_index].append(float(value))
+    constraintes_coef = np.ascontiguousarray(data_frame[ressources_headers].to_numpy(dtype=float).T)
 
     # Get inequality constraints (last row)
-    constraintes_inequality: list[float] = [
-        float(value) for value in data_frame.iloc[-1, :][ressources_headers]
-    ]
+    constraintes_inequality = ressources_row[ressources_headers].to_numpy(dtype=float)[0]
 
     return {
         "decision_vars": decision_vars,
         "decision_vars_coef": decision_vars_coef,
         "constraintes_coef": constraintes_coef,
-        "constraintes_inequality": constraintes_inequality
+        "constraintes_inequality": constraintes_inequality,
+        "ressources_headers": ressources_headers
     }
 
 
-def lp_solve(
-    decision_vars: list[str], 
-    decision_vars_coef: list[float],
-    constraintes_coef: list[list[float]],
-    constraintes_inequality: list[float],
+# Reserved names of the triplet format
+TRIPLET_OBJECTIVE_ROW = "objective"
+TRIPLET_RHS_COLUMN = "rhs"
+
+
+def lp_extract_data_from_triplets(
+    path: str,
+    engine: str = "pyarrow"
+) -> dict[str, list | np.ndarray | sparse.csr_matrix]:
+    # Sparse coordinate format, one non zero per line: constraint,variable,coefficient
+    # - the "objective" constraint holds the objective coefficients
+    # - the "rhs" variable holds the constraint limits
+    triplets = _lp_read_csv(
+        path,
+        engine=engine,
+        dtype={"constraint": str, "variable": str, "coefficient": float}
+    )
+
+    missing_columns = {"constraint", "variable", "coefficient"} - set(triplets.columns)
+    if missing_columns:
+        raise ValueError(f"The triplet file is missing the columns {sorted(missing_columns)}.")
+
+    constraints = triplets["constraint"].to_numpy()
+    variables = triplets["variable"].to_numpy()
+    coefficients = triplets["coefficient"].to_numpy(dtype=float)
+
+    is_objective = constraints == TRIPLET_OBJECTIVE_ROW
+    is_rhs = variables == TRIPLET_RHS_COLUMN
+    is_matrix = ~is_objective & ~is_rhs
+
+    # Integer codes for the names, in order of first appearance
+    var_codes, decision_vars = pd.factorize(np.concatenate([variables[is_matrix], variables[is_objective & ~is_rhs]]))
+    row_codes, ressources_headers = pd.factorize(np.concatenate([constraints[is_matrix], constraints[is_rhs & ~is_objective]]))
+    n_matrix = int(is_matrix.sum())
+    n_vars, n_constraints = len(decision_vars), len(ressources_headers)
+
+    # Duplicated coordinates are summed, as in the COO convention
+    constraintes_coef = sparse.coo_matrix(
+        (coefficients[is_matrix], (row_codes[:n_matrix], var_codes[:n_matrix])),
+        shape=(n_constraints, n_vars)
+    ).tocsr()
+
+    decision_vars_coef = np.zeros(n_vars)
+    np.add.at(decision_vars_coef, var_codes[n_matrix:], coefficients[is_objective & ~is_rhs])
+
+    constraintes_inequality = np.zeros(n_constraints)
+    np.add.at(constraintes_inequality, row_codes[n_matrix:], coefficients[is_rhs & ~is_objective])
+
+    return {
+        "decision_vars": decision_vars.tolist(),
+        "decision_vars_coef": decision_vars_coef,
+        "constraintes_coef": constraintes_coef,
+        "constraintes_inequality": constraintes_inequality,
+        "ressources_headers": ressources_headers.tolist()
+    }
+
+
+def _mps_section_frame(lines: list[str], n_columns: int) -> pd.DataFrame:
+    # Parse the data lines of a section at once with the C engine
+    return pd.read_csv(
+        io.StringIO("\n".join(lines)),
+        sep=r"\s+",
+        header=None,
+        names=range(n_columns),
+        dtype=str,
+        engine="c"
+    )
+
+
+def lp_extract_data_from_mps(path: str) -> dict[str, list | np.ndarray | sparse.csr_matrix | bool]:
+    # Free MPS reader (names without spaces). Every constraint is returned as "<=":
+    # G rows are negated and E rows are split in two opposite rows.
+    sections: dict[str, list[str]] = {}
+    maximize = False
+    current_section = None
+
+    with open(path) as mps_file:
+        for line in mps_file:
+            if not line.strip() or line.startswith("*"):
+                continue
+            if not line[0].isspace():
+                fields = line.split()
+                current_section = fields[0].upper()
+                # OBJSENSE can be given on the same line (OBJSENSE MAX)
+                if current_section == "OBJSENSE" and len(fields) > 1:
+                    maximize = fields[1].upper() in ("MAX", "MAXIMIZE")
+                sections.setdefault(current_section, [])
+                continue
+            if current_section == "OBJSENSE":
+                maximize = line.strip().upper() in ("MAX", "MAXIMIZE")
+            elif current_section is not None:
+                sections[current_section].append(line)
+
+    for unsupported in ("RANGES", "SOS", "QUADOBJ", "QMATRIX"):
+        if sections.get(unsupported):
+            raise ValueError(f"The MPS section {unsupported} is not supported.")
+
+    # ROWS: type and name, the first N row is the objective
+    rows = _mps_section_frame(sections.get("ROWS", []), 2)
+    row_types = rows[0].str.upper().to_numpy()
+    objective_rows = rows[1][row_types == "N"].tolist()
+    if not objective_rows:
+        raise ValueError("The MPS file has no objective (N) row.")
+    objective_row = objective_rows[0]
+
+    constraint_rows = rows[row_types != "N"].reset_index(drop=True)
+    row_index = pd.Index(constraint_rows[1])
+    row_kinds = constraint_rows[0].str.upper().to_numpy()
+
+    # COLUMNS: "variable row value [row value]", integer MARKER lines are skipped
+    columns = _mps_section_frame(
+        [line for line in sections.get("COLUMNS", []) if "MARKER" not in line], 5
+    )
+    entries = pd.concat([
+        columns[[0, 1, 2]].set_axis(["variable", "row", "value"], axis=1),
+        columns[[0, 3, 4]].dropna().set_axis(["variable", "row", "value"], axis=1)
+    ])
+    var_codes, decision_vars = pd.factorize(entries["variable"])
+    values = entries["value"].to_numpy(dtype=float)
+    row_codes = row_index.get_indexer(entries["row"])
+
+    is_objective = entries["row"].to_numpy() == objective_row
+    decision_vars_coef = np.zeros(len(decision_vars))
+    np.add.at(decision_vars_coef, var_codes[is_objective], values[is_objective])
+
+    in_matrix = row_codes >= 0
+    constraint_matrix = sparse.coo_matrix(
+        (values[in_matrix], (row_codes[in_matrix], var_codes[in_matrix])),
+        shape=(len(row_index), len(decision_vars))
+    ).tocsr()
+
+    # RHS: "set row value [row value]"
+    constraint_bounds = np.zeros(len(row_index))
+    if sections.get("RHS"):
+        rhs = _mps_section_frame(sections["RHS"], 5)
+        rhs_entries = pd.concat([
+            rhs[[1, 2]].set_axis(["row", "value"], axis=1),
+            rhs[[3, 4]].dropna().set_axis(["row", "value"], axis=1)
+        ])
+        rhs_codes = row_index.get_indexer(rhs_entries["row"])
+        known = rhs_codes >= 0
+        constraint_bounds[rhs_codes[known]] = rhs_entries["value"].to_numpy(dtype=float)[known]
+
+    # BOUNDS: only the default lower bound 0 is supported; upper bounds become rows
+    upper_rows, upper_vars, upper_values = [], [], []
+    if sections.get("BOUNDS"):
+        bounds = _mps_section_frame(sections["BOUNDS"], 4)
+        kinds = bounds[0].str.upper()
+        if (~kinds.isin(["UP", "LO"])).any():
+            raise ValueError("Only UP and LO bounds are supported in MPS files.")
+        if (bounds[3][kinds == "LO"].astype(float) != 0).any():
+            raise ValueError("Only zero lower bounds are supported in MPS files.")
+        upper = bounds[kinds == "UP"]
+        upper_vars = decision_vars.get_indexer(upper[2])
+        upper_values = upper[3].to_numpy(dtype=float)
+        upper_rows = [f"UB_{name}" for name in upper[2]]
+
+    # Every row as "<=": G rows are negated, E rows get a negated copy
+    is_greater = row_kinds == "G"
+    is_equal = row_kinds == "E"
+    sign = np.where(is_greater, -1.0, 1.0)
+    constraint_matrix = sparse.diags(sign) @ constraint_matrix
+    constraint_bounds = sign * constraint_bounds
+    ressources_headers = row_index.tolist()
+
+    blocks = [constraint_matrix, -constraint_matrix[is_equal]]
+    constraintes_inequality = [constraint_bounds, -constraint_bounds[is_equal]]
+    ressources_headers += [f"{name}_eq" for name in row_index[is_equal]]
+
+    if len(upper_rows):
+        blocks.append(sparse.csr_matrix(
+            (np.ones(len(upper_vars)), (np.arange(len(upper_vars)), upper_vars)),
+            shape=(len(upper_vars), len(decision_vars))
+        ))
+        constraintes_inequality.append(upper_values)
+        ressources_headers += upper_rows
+
+    return {
+        "decision_vars": decision_vars.tolist(),
+        "decision_vars_coef": decision_vars_coef,
+        "constraintes_coef": sparse.vstack(blocks, format="csr"),
+        "constraintes_inequality": np.concatenate(constraintes_inequality),
+        "ressources_headers": ressources_headers,
+        "maximize": maximize
+    }
+
+
+LP_BACKENDS = ["auto", "highs", "cbc"]
+
+# Up to this number of non zero constraint coefficients, the model is solved in-process:
+# starting CBC and exchanging files with it costs more than the solve itself
+LP_IN_PROCESS_MAX_NONZEROS = 100_000
+
+
+def lp_prepare_arrays(
+    decision_vars: list[str],
+    decision_vars_coef,
+    constraintes_coef,
+    constraintes_inequality
+) -> tuple[np.ndarray, sparse.csr_matrix, np.ndarray]:
+    # Constraint matrix in CSR format (dense list / ndarray or any scipy sparse matrix):
+    # zero coefficients are dropped and each row is a contiguous slice
+    objective_coef = np.asarray(decision_vars_coef, dtype=float).ravel()
+    constraint_matrix = sparse.csr_matrix(constraintes_coef, dtype=float)
+    constraint_matrix.eliminate_zeros()
+    constraint_bounds = np.asarray(constraintes_inequality, dtype=float).ravel()
+
+    n_constraints, n_vars = constraint_matrix.shape
+    if len(decision_vars) != n_vars or objective_coef.size != n_vars:
+        raise ValueError("The number of decision variables must match the objective and constraint coefficients.")
+    if constraint_bounds.size != n_constraints:
+        raise ValueError("The number of constraint limits must match the number of constraints.")
+
+    return objective_coef, constraint_matrix, constraint_bounds
+
+
+def _lp_bounds(
+    n_vars: int,
+    lower_bounds: np.ndarray | None,
+    upper_bounds: np.ndarray | None
+) -> tuple[np.ndarray, np.ndarray]:
+    # Decision variables are non negative and unbounded above by default
+    lower = np.zeros(n_vars) if lower_bounds is None else np.asarray(lower_bounds, dtype=float).ravel()
+    upper = np.full(n_vars, np.inf) if upper_bounds is None else np.asarray(upper_bounds, dtype=float).ravel()
+
+    if lower.size != n_vars or upper.size != n_vars:
+        raise ValueError("The variable bounds must have one value per decision variable.")
+    if np.any(~np.isfinite(lower)):
+        raise ValueError("The variable lower bounds must be finite.")
+
+    return lower, upper
+
+
+def lp_build_model(
+    decision_vars: list[str],
+    decision_vars_coef,
+    constraintes_coef,
+    constraintes_inequality,
     maximize: bool,
-) -> dict[str, float]:
+    lower_bounds: np.ndarray | None = None,
+    upper_bounds: np.ndarray | None = None,
+    integrality: np.ndarray | None = None,
+) -> tuple[LpProblem, list[LpVariable]]:
+    objective_coef, constraint_matrix, constraint_bounds = lp_prepare_arrays(
+        decision_vars, decision_vars_coef, constraintes_coef, constraintes_inequality
+    )
+    n_constraints, n_vars = constraint_matrix.shape
+    lower_bounds, upper_bounds = _lp_bounds(n_vars, lower_bounds, upper_bounds)
+    if integrality is None:
+        integrality = np.zeros(n_vars, dtype=bool)
+
     # Instancie the LpProblem model
     lp_prob = LpProblem("lp_problem", LpMaximize if maximize else LpMinimize)
 
-    # Define decision variables
-    decision_variables: dict[str, LpVariable] = dict()
+    # Define decision variables (PuLP uses None for an infinite bound)
+    decision_variables: list[LpVariable] = [
+        LpVariable(
+            name,
+            lowBound=lower,
+            upBound=upper if np.isfinite(upper) else None,
+            cat="Integer" if integer else "Continuous"
+        )
+        for name, lower, upper, integer in zip(
+            decision_vars, lower_bounds.tolist(), upper_bounds.tolist(), np.asarray(integrality, dtype=bool).tolist()
+        )
+    ]
+
+    # Set Objective function (built in one go; it keeps every variable, even with
+    # a zero coefficient, so that unconstrained variables still belong to the model)
+    lp_prob.setObjective(LpAffineExpression(zip(decision_variables, objective_coef.tolist())))
+
+    # Set Constraintes: each row expression is created directly from its (variable, coefficient) pairs
+    indptr = constraint_matrix.indptr.tolist()
+    indices = constraint_matrix.indices.tolist()
+    data = constraint_matrix.data.tolist()
+    bounds = constraint_bounds.tolist()
+
+    for i in range(n_constraints):
+        row = slice(indptr[i], indptr[i + 1])
+        expression = LpAffineExpression(zip(
+            [decision_variables[j] for j in indices[row]],
+            data[row]
+        ))
+        lp_prob.addConstraint(LpConstraint(expression, LpConstraintLE, rhs=bounds[i]), name=f"_C{i+1}")
 
-    for i in range(len(decision_vars)):
-        decision_variables.update({
-            f"x{i+1}": LpVariable(decision_vars[i], lowBound=0)
-        })
-    # print(decision_variables)
+    return lp_prob, decision_variables
 
-    # Set Objective function
-    objective_func = LpAffineExpression()
-    for index in range(len(decision_vars)):
-        objective_func += decision_vars_coef[index] * decision_variables[f"x{index+1}"]
 
-    lp_prob += objective_func
+def lp_select_backend(constraint_matrix: sparse.csr_matrix) -> str:
+    return "highs" if constraint_matrix.nnz <= LP_IN_PROCESS_MAX_NONZEROS else "cbc"
 
-    # Set Constraintes
-    # print(constraintes_coef)
-    for i in range(len(constraintes_coef)):
-        constrainte = LpAffineExpression()
 
-        for j in range(len(decision_vars)):
-            constrainte += constraintes_coef[i][j] * decision_variables[f"x{j+1}"]
-        
-        lp_prob += constrainte <= constraintes_inequality[i]
-    
-    # print(lp_prob)
+# linprog status codes, named as the PuLP statuses
+HIGHS_STATUS = {0: "Optimal", 1: "Not Solved", 2: "Infeasible", 3: "Unbounded", 4: "Not Solved"}
 
-    # Resolve
+
+def _lp_solve_cbc(
+    decision_vars: list[str],
+    objective_coef: np.ndarray,
+    constraint_matrix: sparse.csr_matrix,
+    constraint_bounds: np.ndarray,
+    maximize: bool,
+    lower_bounds: np.ndarray | None = None,
+    upper_bounds: np.ndarray | None = None
+) -> dict:
+    lp_prob, decision_variables = lp_build_model(
+        decision_vars=decision_vars,
+        decision_vars_coef=objective_coef,
+        constraintes_coef=constraint_matrix,
+        constraintes_inequality=constraint_bounds,
+        maximize=maximize,
+        lower_bounds=lower_bounds,
+        upper_bounds=upper_bounds
+    )
+
+    # Resolve (CBC runs as an external process)
     lp_prob.solve()
-    # print(LpStatus[solve_status])
+    constraints = list(lp_prob.constraints.values())
+
+    # PuLP already reports duals and reduced costs in the sense of the problem,
+    # and slacks as rhs - lhs
+    return {
+        "status": LpStatus[lp_prob.status],
+        "x": np.array([value(var) for var in decision_variables], dtype=float),
+        "duals": np.array([constraint.pi for constraint in constraints], dtype=float),
+        "slacks": np.array([constraint.slack for constraint in constraints], dtype=float),
+        "reduced_costs": np.array([var.dj for var in decision_variables], dtype=float)
+    }
+
+
+def _lp_solve_highs(
+    decision_vars: list[str],
+    objective_coef: np.ndarray,
+    constraint_matrix: sparse.csr_matrix,
+    constraint_bounds: np.ndarray,
+    maximize: bool,
+    lower_bounds: np.ndarray | None = None,
+    upper_bounds: np.ndarray | None = None
+) -> dict:
+    n_constraints, n_vars = constraint_matrix.shape
+    lower_bounds, upper_bounds = _lp_bounds(n_vars, lower_bounds, upper_bounds)
+
+    # HiGHS is linked into scipy: the model never leaves the process.
+    # linprog minimizes, so a maximization is solved on the opposite objective.
+    result = optimize.linprog(
+        c=-objective_coef if maximize else objective_coef,
+        A_ub=constraint_matrix if n_constraints else None,
+        b_ub=constraint_bounds if n_constraints else None,
+        bounds=np.column_stack([lower_bounds, upper_bounds]),
+        method="highs"
+    )
+
+    if result.x is None:
+        return {
+            "status": HIGHS_STATUS[result.status],
+            "x": np.full(n_vars, np.nan),
+            "duals": np.full(n_constraints, np.nan),
+            "slacks": np.full(n_constraints, np.nan),
+            "reduced_costs": np.full(n_vars, np.nan)
+        }
+
+    # Marginals are the sensitivities of the minimized objective: flip them back for a maximization
+    sign = -1.0 if maximize else 1.0
+    duals = sign * result.ineqlin.marginals if n_constraints else np.empty(0)
+    slacks = result.ineqlin.residual if n_constraints else np.empty(0)
+
+    return {
+        "status": HIGHS_STATUS[result.status],
+        "x": result.x,
+        "duals": duals,
+        "slacks": slacks,
+        "reduced_costs": sign * (result.lower.marginals + result.upper.marginals)
+    }
+
+
+def _lp_rhs_ranging(
+    constraint_matrix: sparse.csr_matrix,
+    constraint_bounds: np.ndarray,
+    x: np.ndarray,
+    slacks: np.ndarray,
+    duals: np.ndarray,
+    reduced_costs: np.ndarray,
+    lower_bounds: np.ndarray | None = None,
+    upper_bounds: np.ndarray | None = None,
+    tolerance: float = 1e-9
+) -> np.ndarray:
+    # Range [lower, upper] of each limit b_i over which the optimal basis stays optimal,
+    # derived from the basis of the solve already done: x_B(b + t e_i) = x_B + t B^-1 e_i
+    # must stay within the bounds of the basic variables (slacks >= 0)
+    n_constraints, n_vars = constraint_matrix.shape
+    ranges = np.full((n_constraints, 2), np.nan)
+    if n_constraints == 0:
+        return ranges
+
+    lower_bounds, upper_bounds = _lp_bounds(n_vars, lower_bounds, upper_bounds)
+
+    # Basic variables: structural variables strictly between their bounds and positive slacks;
+    # a variable at one of its bounds is non basic and keeps its value.
+    basic_vars = np.flatnonzero((x > lower_bounds + tolerance) & (x < upper_bounds - tolerance))
+    basic_slacks = np.flatnonzero(slacks > tolerance)
+
+    # On a degenerate vertex the basis is completed with columns consistent with the duals:
+    # binding slacks with a zero dual and variables at a bound with a zero reduced cost,
+    # picked linearly independent (pivoted QR of their part outside the current basis span)
+    missing = n_constraints - basic_vars.size - basic_slacks.size
+    if missing > 0:
+        candidate_vars = np.setdiff1d(np.flatnonzero(np.abs(reduced_costs) <= tolerance), basic_vars)
+        candidate_slacks = np.setdiff1d(np.flatnonzero(np.abs(duals) <= tolerance), basic_slacks)
+        candidates = np.hstack([
+            constraint_matrix[:, candidate_vars].toarray(),
+            np.eye(n_constraints)[:, candidate_slacks]
+        ])
+        if candidates.shape[1] < missing:
+            return ranges
+
+        current = np.hstack([
+            constraint_matrix[:, basic_vars].toarray(),
+            np.eye(n_constraints)[:, basic_slacks]
+        ])
+        if current.shape[1]:
+            span = linalg.qr(current, mode="economic")[0]
+            candidates = candidates - span @ (span.T @ candidates)
+
+        _, triangular, order = linalg.qr(candidates, mode="economic", pivoting=True)
+        if np.abs(triangular[missing - 1, missing - 1]) <= tolerance * max(1.0, np.abs(triangular[0, 0])):
+            return ranges
+
+        chosen = np.sort(order[:missing])
+        basic_vars = np.sort(np.concatenate([basic_vars, candidate_vars[chosen[chosen < candidate_vars.size]]]))
+        basic_slacks = np.sort(np.concatenate([basic_slacks, candidate_slacks[chosen[chosen >= candidate_vars.size] - candidate_vars.size]]))
+    if basic_vars.size + basic_slacks.size != n_constraints:
+        return ranges
+
+    basis = sparse.hstack([
+        constraint_matrix[:, basic_vars],
+        sparse.identity(n_constraints, format="csr")[:, basic_slacks]
+    ]).tocsc()
+    basic_values = np.concatenate([x[basic_vars], slacks[basic_slacks]])
+    basic_lower = np.concatenate([lower_bounds[basic_vars], np.zeros(basic_slacks.size)])
+    basic_upper = np.concatenate([upper_bounds[basic_vars], np.full(basic_slacks.size, np.inf)])
+
+    try:
+        basis_inverse = sparse_linalg.splu(basis).solve(np.eye(n_constraints))
+    except RuntimeError:
+        # Singular basis: the solution was not a vertex
+        return ranges
+
+    # Ratio test: the step t at which each basic variable reaches its lower or upper bound
+    with np.errstate(divide="ignore", invalid="ignore"):
+        to_lower = (basic_lower - basic_values)[:, np.newaxis] / basis_inverse
+        to_upper = (basic_upper - basic_values)[:, np.newaxis] / basis_inverse
+        increasing = basis_inverse > tolerance
+        decreasing = basis_inverse < -tolerance
+        lower = np.maximum(
+            np.where(increasing, to_lower, -np.inf).max(axis=0),
+            np.where(decreasing, to_upper, -np.inf).max(axis=0)
+        )
+        upper = np.minimum(
+            np.where(increasing, to_upper, np.inf).min(axis=0),
+            np.where(decreasing, to_lower, np.inf).min(axis=0)
+        )
+
+    ranges[:, 0] = constraint_bounds + lower
+    ranges[:, 1] = constraint_bounds + upper
+
+    return ranges
+
+
+def lp_presolve(
+    objective_coef: np.ndarray,
+    constraint_matrix: sparse.csr_matrix,
+    constraint_bounds: np.ndarray,
+    maximize: bool,
+    lower_bounds: np.ndarray | None = None,
+    upper_bounds: np.ndarray | None = None,
+    max_passes: int = 10,
+    tolerance: float = 1e-9
+) -> dict:
+    # Reduce "max/min c x, A x <= b, l <= x <= u" before the model is built.
+    # Rows and columns are only flagged as removed; the kept ones are sliced at the end.
+    n_constraints, n_vars = constraint_matrix.shape
+    lower, upper = _lp_bounds(n_vars, lower_bounds, upper_bounds)
+    lower, upper = lower.copy(), upper.copy()
+    bounds = np.array(constraint_bounds, dtype=float)
+    csc_matrix = constraint_matrix.tocsc()
+
+    active_rows = np.ones(n_constraints, dtype=bool)
+    active_cols = np.ones(n_vars, dtype=bool)
+    fixed_values = np.full(n_vars, np.nan)
+    # Direction in which each variable improves the objective
+    direction = objective_coef if maximize else -objective_coef
+
+    report = {
+        "empty_rows": [],
+        "singleton_rows": [],
+        "duplicate_rows": [],
+        "empty_columns": [],
+        "dominated_columns": [],
+        "fixed_columns": [],
+        "tightened_bounds": 0,
+        "passes": 0
+    }
+    status = None
+
+    def fix_columns(columns: np.ndarray, values: np.ndarray) -> None:
+        # x_j = v: move a_j v to the right-hand side and drop the column
+        fixed_values[columns] = values
+        active_cols[columns] = False
+        bounds[:] -= csc_matrix[:, columns] @ values
+
+    for _ in range(max_passes):
+        report["passes"] += 1
+        changed = False
+
+        # Columns already fixed by their bounds
+        fixed = np.flatnonzero(active_cols & (upper - lower <= tolerance))
+        if fixed.size:
+            fix_columns(fixed, lower[fixed])
+            report["fixed_columns"] += fixed.tolist()
+            changed = True
+
+        # Rows of the active sub-matrix
+        sub_matrix = constraint_matrix[:, active_cols].tocsr()
+        sub_matrix.eliminate_zeros()
+        row_nnz = np.diff(sub_matrix.indptr)
+        col_index = np.flatnonzero(active_cols)
+
+        # Empty rows: 0 <= b_i must hold
+        empty_rows = np.flatnonzero(active_rows & (row_nnz == 0))
+        if np.any(bounds[empty_rows] < -tolerance):
+            status = "Infeasible"
+            break
+        if empty_rows.size:
+            active_rows[empty_rows] = False
+            report["empty_rows"] += empty_rows.tolist()
+            changed = True
+
+        # Singleton rows a x_j <= b_i become bounds on x_j
+        singleton_rows = np.flatnonzero(active_rows & (row_nnz == 1))
+        if singleton_rows.size:
+            starts = sub_matrix.indptr[singleton_rows]
+            columns = col_index[sub_matrix.indices[starts]]
+            coefficients = sub_matrix.data[starts]
+            limits = bounds[singleton_rows] / coefficients
+
+            positive = coefficients > 0
+            previous_lower, previous_upper = lower.copy(), upper.copy()
+            np.minimum.at(upper, columns[positive], limits[positive])
+            np.maximum.at(lower, columns[~positive], limits[~positive])
+            report["tightened_bounds"] += int(np.sum(upper < previous_upper) + np.sum(lower > previous_lower))
+
+            active_rows[singleton_rows] = False
+            report["singleton_rows"] += singleton_rows.tolist()
+            changed = True
+
+            if np.any(lower > upper + tolerance):
+                status = "Infeasible"
+                break
+            upper = np.maximum(upper, lower)
+
+        # Duplicate rows: rows equal up to a positive factor, only the tightest limit is kept
+        candidate_rows = np.flatnonzero(active_rows & (row_nnz >= 2))
+        tightest: dict[bytes, tuple[int, float]] = {}
+        for i in candidate_rows.tolist():
+            row = slice(sub_matrix.indptr[i], sub_matrix.indptr[i + 1])
+            scale = np.abs(sub_matrix.data[row]).max()
+            key = sub_matrix.indices[row].tobytes() + np.round(sub_matrix.data[row] / scale, 12).tobytes()
+            limit = bounds[i] / scale
+
+            if key not in tightest:
+                tightest[key] = (i, limit)
+                continue
+
+            kept, kept_limit = tightest[key]
+            removed = i if limit >= kept_limit else kept
+            if removed == kept:
+                tightest[key] = (i, limit)
+            active_rows[removed] = False
+            report["duplicate_rows"].append(removed)
+            changed = True
+
+        # Columns of the remaining rows
+        sub_matrix = csc_matrix[active_rows][:, active_cols].tocsc()
+        sub_matrix.eliminate_zeros()
+        col_nnz = np.diff(sub_matrix.indptr)
+        col_min = np.zeros(col_index.size)
+        col_max = np.zeros(col_index.size)
+        has_entries = col_nnz > 0
+        if sub_matrix.nnz:
+            col_min[has_entries] = np.minimum.reduceat(sub_matrix.data, sub_matrix.indptr[:-1][has_entries])
+            col_max[has_entries] = np.maximum.reduceat(sub_matrix.data, sub_matrix.indptr[:-1][has_entries])
+
+        improving = direction[col_index] > tolerance
+
+        # A column that only relaxes constraints when it increases, and improves the objective,
+        # goes to its upper bound. Without one, the problem is unbounded only if it is feasible:
+        # the column is left to the solver.
+        to_upper = improving & (col_max <= 0) & np.isfinite(upper[col_index])
+
+        # A column that only consumes resources and does not improve the objective stays at its lower bound
+        to_lower = ~improving & (col_min >= 0)
+
+        for mask, values in ((to_upper, upper), (to_lower, lower)):
+            columns = col_index[mask]
+            if columns.size:
+                fix_columns(columns, values[columns])
+                empty = col_nnz[mask] == 0
+                report["empty_columns"] += columns[empty].tolist()
+                report["dominated_columns"] += columns[~empty].tolist()
+                changed = True
+
+        if not changed:
+            break
+
+    rows = np.flatnonzero(active_rows)
+    columns = np.flatnonzero(active_cols)
+
+    report["rows"] = (n_constraints, int(rows.size))
+    report["columns"] = (n_vars, int(columns.size))
+
+    return {
+        "status": status,
+        "objective_coef": objective_coef[columns],
+        "constraint_matrix": constraint_matrix[rows][:, columns].tocsr(),
+        "constraint_bounds": bounds[rows],
+        "lower_bounds": lower[columns],
+        "upper_bounds": upper[columns],
+        "rows": rows,
+        "columns": columns,
+        "fixed_values": fixed_values,
+        "report": report
+    }
+
+
+def lp_postsolve(presolved: dict, x: np.ndarray) -> np.ndarray:
+    # Map the solution of the reduced model back to the original variables
+    solution = presolved["fixed_values"].copy()
+    solution[presolved["columns"]] = x
+
+    return solution
+
+
+LP_CACHE_MEMORY_BYTES = 64 * 1024 ** 2
+LP_CACHE_DISK_BYTES = 1024 ** 3
+
+
+def _lp_result_nbytes(result: dict) -> int:
+    # Only the arrays matter: the presolve report is a few integers
+    return sum(val.nbytes for val in result.values() if isinstance(val, np.ndarray)) + 256
+
+
+# Solutions of already solved models, keyed by the canonical hash of the model.
+# Memory only by default; lp_cache_configure adds a persistent SQLite tier.
+_lp_cache = TieredCache(LP_CACHE_MEMORY_BYTES, _lp_result_nbytes)
+
+
+def lp_cache_configure(
+    memory_bytes: int = LP_CACHE_MEMORY_BYTES,
+    disk_path: str | None = None,
+    disk_bytes: int = LP_CACHE_DISK_BYTES,
+    ttl: float | None = None
+) -> None:
+    global _lp_cache
+
+    disk = SQLiteCache(disk_path, disk_bytes, ttl) if disk_path is not None else None
+    _lp_cache = TieredCache(memory_bytes, _lp_result_nbytes, disk, ttl)
+
+
+def lp_cache_stats() -> dict[str, dict[str, int] | None]:
+    return _lp_cache.stats()
 
-    # Set solutions
-    solutions: dict[str, float] = dict()
-    for name, val in decision_variables.items():
-        solutions.update({val.name: value(val)})
-    
-    return solutions
+
+def lp_cache_clear() -> None:
+    _lp_cache.clear()
+
+
+def lp_model_key(
+    objective_coef: np.ndarray,
+    constraint_matrix: sparse.csr_matrix,
+    constraint_bounds: np.ndarray,
+    maximize: bool,
+    lower_bounds: np.ndarray | None = None,
+    upper_bounds: np.ndarray | None = None,
+    **options
+) -> str:
+    # Canonical form of the model: the same problem always gets the same key, whatever
+    # the order or duplication of its sparse entries and the names of its variables
+    canonical = sparse.csr_matrix(constraint_matrix, dtype=np.float64, copy=True)
+    canonical.sum_duplicates()
+    canonical.eliminate_zeros()
+    canonical.sort_indices()
+
+    n = canonical.shape[1]
+    lower, upper = _lp_bounds(n, lower_bounds, upper_bounds)
+
+    digest = hashlib.blake2b(digest_size=32)
+    digest.update(repr((bool(maximize), canonical.shape, sorted(options.items()))).encode())
+    # "+ 0.0" turns -0.0 into 0.0 so that both hash the same
+    for array in (
+        np.asarray(objective_coef, dtype=np.float64) + 0.0,
+        canonical.indptr.astype(np.int64),
+        canonical.indices.astype(np.int64),
+        canonical.data + 0.0,
+        np.asarray(constraint_bounds, dtype=np.float64) + 0.0,
+        lower + 0.0,
+        upper + 0.0
+    ):
+        digest.update(np.ascontiguousarray(array).tobytes())
+
+    return digest.hexdigest()
+
+
+def _lp_solve_arrays(
+    decision_vars: list[str],
+    objective_coef: np.ndarray,
+    constraint_matrix: sparse.csr_matrix,
+    constraint_bounds: np.ndarray,
+    maximize: bool,
+    backend: str,
+    ranging: bool,
+    presolve: bool,
+    lower_bounds: np.ndarray | None = None,
+    upper_bounds: np.ndarray | None = None
+) -> dict:
+    # Solves the model and returns its results as arrays (NaN where there is no value)
+    n_constraints = constraint_matrix.shape[0]
+    solve = _lp_solve_highs if backend == "highs" else _lp_solve_cbc
+
+    presolve_report = None
+    if not presolve:
+        solution = solve(
+            decision_vars, objective_coef, constraint_matrix, constraint_bounds, maximize,
+            lower_bounds=lower_bounds, upper_bounds=upper_bounds
+        )
+    else:
+        presolved = lp_presolve(
+            objective_coef, constraint_matrix, constraint_bounds, maximize, lower_bounds, upper_bounds
+        )
+        presolve_report = presolved["report"]
+        columns, rows = presolved["columns"], presolved["rows"]
+
+        if presolved["status"] is not None:
+            reduced = {"status": presolved["status"]}
+        elif columns.size == 0:
+            # Every variable was fixed: nothing left for the solver
+            reduced = {"status": "Optimal", "x": np.empty(0), "duals": np.empty(0), "reduced_costs": np.empty(0)}
+        else:
+            reduced = solve(
+                [decision_vars[j] for j in columns],
+                presolved["objective_coef"],
+                presolved["constraint_matrix"],
+                presolved["constraint_bounds"],
+                maximize,
+                lower_bounds=presolved["lower_bounds"],
+                upper_bounds=presolved["upper_bounds"]
+            )
+
+        # Removed rows and fixed columns have no dual value / reduced cost from the reduced model
+        solution = {
+            "status": reduced["status"],
+            "x": np.full(objective_coef.size, np.nan),
+            "duals": np.full(n_constraints, np.nan),
+            "slacks": np.full(n_constraints, np.nan),
+            "reduced_costs": np.full(objective_coef.size, np.nan)
+        }
+        if reduced["status"] == "Optimal":
+            solution["x"] = lp_postsolve(presolved, reduced["x"])
+            solution["duals"][rows] = reduced["duals"]
+            solution["slacks"] = constraint_bounds - constraint_matrix @ solution["x"]
+            solution["reduced_costs"][columns] = reduced["reduced_costs"]
+
+        # The basis of the reduced model does not describe the original limits
+        ranging = False
+
+    solution["ranges"] = np.full((n_constraints, 2), np.nan)
+    if ranging and solution["status"] == "Optimal":
+        solution["ranges"] = _lp_rhs_ranging(
+            constraint_matrix, constraint_bounds,
+            solution["x"], solution["slacks"], solution["duals"], solution["reduced_costs"],
+            lower_bounds, upper_bounds
+        )
+
+    solution["presolve"] = presolve_report
+
+    return solution
+
+
+def lp_solve_detailed(
+    decision_vars: list[str],
+    decision_vars_coef: list[float],
+    constraintes_coef: list[list[float]],
+    constraintes_inequality: list[float],
+    maximize: bool,
+    backend: str = "auto",
+    constraintes_names: list[str] | None = None,
+    ranging: bool = True,
+    presolve: bool = False,
+    use_cache: bool = True,
+    lower_bounds: np.ndarray | None = None,
+    upper_bounds: np.ndarray | None = None,
+) -> dict:
+    if backend not in LP_BACKENDS:
+        raise ValueError(f"Unknown backend '{backend}', expected one of {LP_BACKENDS}.")
+
+    objective_coef, constraint_matrix, constraint_bounds = lp_prepare_arrays(
+        decision_vars, decision_vars_coef, constraintes_coef, constraintes_inequality
+    )
+    n_constraints = constraint_matrix.shape[0]
+
+    if constraintes_names is None:
+        constraintes_names = [f"C{i+1}" for i in range(n_constraints)]
+    if len(constraintes_names) != n_constraints:
+        raise ValueError("The number of constraint names must match the number of constraints.")
+
+    if backend == "auto":
+        backend = lp_select_backend(constraint_matrix)
+
+    solution = None
+    if use_cache:
+        key = lp_model_key(
+            objective_coef, constraint_matrix, constraint_bounds, maximize, lower_bounds, upper_bounds,
+            backend=backend, ranging=ranging, presolve=presolve
+        )
+        solution = _lp_cache.get(key)
+
+    cached = solution is not None
+    if not cached:
+        solution = _lp_solve_arrays(
+            decision_vars, objective_coef, constraint_matrix, constraint_bounds,
+            maximize, backend, ranging, presolve, lower_bounds, upper_bounds
+        )
+        # A solver failure may be transient (time limit, missing binary): only keep real answers
+        if use_cache and solution["status"] in ("Optimal", "Infeasible", "Unbounded"):
+            _lp_cache.put(key, solution)
+
+    # Same variable names on every backend (PuLP replaces illegal characters by "_")
+    names = [str(name).translate(LpElement.trans) for name in decision_vars]
+    solved = solution["status"] == "Optimal"
+
+    def to_dict(keys: list[str], values: np.ndarray) -> dict[str, float | None]:
+        return {key: (None if np.isnan(val) else val) for key, val in zip(keys, values.tolist())}
+
+    rhs_ranging = {
+        name: (None if np.isnan(lower) else lower, None if np.isnan(upper) else upper)
+        for name, (lower, upper) in zip(constraintes_names, solution["ranges"].tolist())
+    }
+
+    return {
+        "status": solution["status"],
+        "objective": float(objective_coef @ solution["x"]) if solved else None,
+        "variables": to_dict(names, solution["x"]),
+        "reduced_costs": to_dict(names, solution["reduced_costs"]),
+        "duals": to_dict(constraintes_names, solution["duals"]),
+        "slacks": to_dict(constraintes_names, solution["slacks"]),
+        "rhs_ranging": rhs_ranging,
+        "presolve": solution["presolve"],
+        "cached": cached
+    }
+
+
+LP_VARIABLE_TYPES = ["continuous", "integer", "binary"]
+
+# CBC log lines carrying the incumbent ("Integer solution of ...") or the bound ("best possible ...")
+CBC_INCUMBENT_LOG = re.compile(r"^Cbc00(?:04|12)I Integer solution of (\S+) .*\((\S+) seconds\)")
+CBC_BOUND_LOG = re.compile(r"^Cbc0010I After \d+ nodes, .* (\S+) best solution, best possible (\S+) \((\S+) seconds\)")
+CBC_FINAL_LOG = re.compile(
+    r"^Cbc000[15]I (?:Partial search|Search completed) - best objective (\S+?),? (?:\(best possible (\S+)\), )?took .* \((\S+) seconds\)"
+)
+
+
+def _lp_integrality(
+    variable_types: list[str] | None,
+    lower_bounds: np.ndarray,
+    upper_bounds: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # Integer mask of the variables; binary variables are integers bounded to [0, 1]
+    n_vars = lower_bounds.size
+    if variable_types is None:
+        return np.zeros(n_vars, dtype=bool), lower_bounds, upper_bounds
+
+    variable_types = np.asarray(variable_types, dtype=str)
+    if variable_types.size != n_vars:
+        raise ValueError("The variable types must have one value per decision variable.")
+
+    unknown = np.setdiff1d(variable_types, LP_VARIABLE_TYPES)
+    if unknown.size:
+        raise ValueError(f"Unknown variable type '{unknown[0]}', expected one of {LP_VARIABLE_TYPES}.")
+
+    binary = variable_types == "binary"
+    lower = np.where(binary, np.maximum(lower_bounds, 0.0), lower_bounds)
+    upper = np.where(binary, np.minimum(upper_bounds, 1.0), upper_bounds)
+
+    return variable_types != "continuous", lower, upper
+
+
+def _lp_mip_gap(objective: float | None, bound: float | None) -> float | None:
+    if objective is None or bound is None or not np.isfinite(bound):
+        return None
+
+    return abs(bound - objective) / max(abs(objective), 1e-10)
+
+
+def _lp_parse_cbc_log(path: str, maximize: bool) -> pd.DataFrame:
+    # Incumbent / bound trajectory of a CBC run. CBC minimizes: for a maximization the
+    # logged values are the opposite of the objective. Each row carries the last known values.
+    sign = -1.0 if maximize else 1.0
+    incumbent, bound = np.nan, np.nan
+    rows = []
+
+    with open(path, "r", errors="replace") as file:
+        for line in file:
+            match = CBC_INCUMBENT_LOG.match(line)
+            if match:
+                found = sign * float(match.group(1))
+                # Heuristics may report worse solutions than the incumbent
+                if np.isnan(incumbent) or (found > incumbent if maximize else found < incumbent):
+                    incumbent = found
+                rows.append((float(match.group(2)), incumbent, bound))
+                continue
+
+            match = CBC_BOUND_LOG.match(line) or CBC_FINAL_LOG.match(line)
+            if match:
+                # 1e+50 is CBC's "no solution yet"; a completed search closes the bound
+                if abs(float(match.group(1))) < 1e50:
+                    incumbent = sign * float(match.group(1))
+                bound = sign * float(match.group(2)) if match.group(2) is not None else incumbent
+                rows.append((float(match.group(3)), incumbent, bound))
+
+    return pd.DataFrame(rows, columns=["time", "incumbent", "bound"])
+
+
+def _lp_solve_milp_cbc(
+    decision_vars: list[str],
+    objective_coef: np.ndarray,
+    constraint_matrix: sparse.csr_matrix,
+    constraint_bounds: np.ndarray,
+    maximize: bool,
+    integrality: np.ndarray,
+    lower_bounds: np.ndarray,
+    upper_bounds: np.ndarray,
+    threads: int,
+    time_limit: float | None,
+    gap_rel: float | None
+) -> dict:
+    lp_prob, decision_variables = lp_build_model(
+        decision_vars=decision_vars,
+        decision_vars_coef=objective_coef,
+        constraintes_coef=constraint_matrix,
+        constraintes_inequality=constraint_bounds,
+        maximize=maximize,
+        lower_bounds=lower_bounds,
+        upper_bounds=upper_bounds,
+        integrality=integrality
+    )
+
+    # The log is the only place where CBC reports its progress
+    log_file, log_path = tempfile.mkstemp(suffix=".log")
+    os.close(log_file)
+
+    try:
+        lp_prob.solve(PULP_CBC_CMD(
+            msg=False,
+            threads=threads,
+            timeLimit=time_limit,
+            gapRel=gap_rel,
+            logPath=log_path
+        ))
+        trajectory = _lp_parse_cbc_log(log_path, maximize)
+    finally:
+        os.unlink(log_path)
+
+    has_solution = lp_prob.sol_status in (LpSolutionOptimal, LpSolutionIntegerFeasible)
+    objective = value(lp_prob.objective) if has_solution else None
+
+    # Last bound reported by CBC; an optimal search closes it on the incumbent
+    bound = trajectory["bound"].iloc[-1] if len(trajectory) else np.nan
+    if lp_prob.sol_status == LpSolutionOptimal:
+        bound = objective
+    elif has_solution and np.isfinite(bound):
+        bound = min(bound, objective) if not maximize else max(bound, objective)
+
+    return {
+        "status": LpStatus[lp_prob.status],
+        "solution_status": LpSolution[lp_prob.sol_status],
+        "x": np.array([value(var) if has_solution else np.nan for var in decision_variables], dtype=float),
+        "objective": objective,
+        "bound": None if bound is None or np.isnan(bound) else float(bound),
+        "trajectory": trajectory
+    }
+
+
+def _lp_solve_milp_highs(
+    objective_coef: np.ndarray,
+    constraint_matrix: sparse.csr_matrix,
+    constraint_bounds: np.ndarray,
+    maximize: bool,
+    integrality: np.ndarray,
+    lower_bounds: np.ndarray,
+    upper_bounds: np.ndarray,
+    time_limit: float | None,
+    gap_rel: float | None
+) -> dict:
+    n_constraints, n_vars = constraint_matrix.shape
+    sign = -1.0 if maximize else 1.0
+
+    options = {"disp": False}
+    if time_limit is not None:
+        options["time_limit"] = time_limit
+    if gap_rel is not None:
+        options["mip_rel_gap"] = gap_rel
+
+    start = time.perf_counter()
+    result = optimize.milp(
+        c=sign * objective_coef,
+        integrality=integrality.astype(int),
+        bounds=optimize.Bounds(lower_bounds, upper_bounds),
+        constraints=optimize.LinearConstraint(constraint_matrix, -np.inf, constraint_bounds) if n_constraints else None,
+        options=options
+    )
+    elapsed = time.perf_counter() - start
+
+    # Same status names as PuLP: a time limit with an incumbent is a feasible, not proven, solution
+    has_solution = result.x is not None
+    if result.status == 0:
+        status, solution_status = "Optimal", LpSolution[LpSolutionOptimal]
+    elif result.status == 1 and has_solution:
+        status, solution_status = "Optimal", LpSolution[LpSolutionIntegerFeasible]
+    else:
+        status = HIGHS_STATUS[result.status]
+        solution_status = LpSolution[LpSolutionNoSolutionFound]
+
+    objective = float(objective_coef @ result.x) if has_solution else None
+    bound = getattr(result, "mip_dual_bound", None)
+    bound = sign * bound if bound is not None and np.isfinite(bound) else objective
+
+    # scipy does not expose HiGHS progress callbacks: only the final point is known
+    trajectory = pd.DataFrame(
+        [(elapsed, np.nan if objective is None else objective, np.nan if bound is None else bound)],
+        columns=["time", "incumbent", "bound"]
+    )
+
+    return {
+        "status": status,
+        "solution_status": solution_status,
+        "x": result.x if has_solution else np.full(n_vars, np.nan),
+        "objective": objective,
+        "bound": bound,
+        "trajectory": trajectory
+    }
+
+
+def lp_solve_milp(
+    decision_vars: list[str],
+    decision_vars_coef: list[float],
+    constraintes_coef: list[list[float]],
+    constraintes_inequality: list[float],
+    maximize: bool,
+    variable_types: list[str] | None = None,
+    lower_bounds: np.ndarray | None = None,
+    upper_bounds: np.ndarray | None = None,
+    backend: str = "auto",
+    threads: int | None = None,
+    time_limit: float | None = None,
+    gap_rel: float | None = None,
+) -> dict:
+    if backend not in LP_BACKENDS:
+        raise ValueError(f"Unknown backend '{backend}', expected one of {LP_BACKENDS}.")
+    if threads is not None and threads < 1:
+        raise ValueError("The number of threads must be at least 1.")
+    if time_limit is not None and time_limit <= 0:
+        raise ValueError("The time limit must be a positive number of seconds.")
+    if gap_rel is not None and gap_rel < 0:
+        raise ValueError("The relative gap must be non negative.")
+    # scipy runs HiGHS branch and bound on a single thread
+    if backend == "highs" and threads is not None and threads > 1:
+        raise ValueError("The HiGHS backend runs on a single thread: use the CBC backend for several threads.")
+
+    objective_coef, constraint_matrix, constraint_bounds = lp_prepare_arrays(
+        decision_vars, decision_vars_coef, constraintes_coef, constraintes_inequality
+    )
+    n_vars = constraint_matrix.shape[1]
+    lower, upper = _lp_bounds(n_vars, lower_bounds, upper_bounds)
+    integrality, lower, upper = _lp_integrality(variable_types, lower, upper)
+
+    # Several threads asked for explicitly: only CBC can use them
+    if backend == "auto":
+        backend = "cbc" if threads is not None and threads > 1 else lp_select_backend(constraint_matrix)
+
+    # Every core of the machine by default (CBC only)
+    threads = 1 if backend == "highs" else threads or os.cpu_count() or 1
+
+    if backend == "highs":
+        solution = _lp_solve_milp_highs(
+            objective_coef, constraint_matrix, constraint_bounds, maximize,
+            integrality, lower, upper, time_limit, gap_rel
+        )
+    else:
+        solution = _lp_solve_milp_cbc(
+            decision_vars, objective_coef, constraint_matrix, constraint_bounds, maximize,
+            integrality, lower, upper, threads, time_limit, gap_rel
+        )
+
+    # Same variable names on every backend (PuLP replaces illegal characters by "_")
+    names = [str(name).translate(LpElement.trans) for name in decision_vars]
+
+    return {
+        "status": solution["status"],
+        "solution_status": solution["solution_status"],
+        "objective": solution["objective"],
+        "best_bound": solution["bound"],
+        "gap": _lp_mip_gap(solution["objective"], solution["bound"]),
+        "variables": {name: (None if np.isnan(val) else val) for name, val in zip(names, solution["x"].tolist())},
+        "trajectory": solution["trajectory"],
+        "backend": backend,
+        "threads": threads
+    }
+
+
+def lp_solve(
+    decision_vars: list[str], 
+    decision_vars_coef: list[float],
+    constraintes_coef: list[list[float]],
+    constraintes_inequality: list[float],
+    maximize: bool,
+    backend: str = "auto",
+    presolve: bool = True,
+    variable_types: list[str] | None = None,
+    lower_bounds: np.ndarray | None = None,
+    upper_bounds: np.ndarray | None = None,
+    threads: int | None = None,
+    time_limit: float | None = None,
+    gap_rel: float | None = None,
+) -> dict[str, float]:
+    # Integer variables or solver limits go through the branch and bound
+    is_mip = variable_types is not None and any(var_type != "continuous" for var_type in variable_types)
+    if is_mip or threads is not None or time_limit is not None or gap_rel is not None:
+        result = lp_solve_milp(
+            decision_vars=decision_vars,
+            decision_vars_coef=decision_vars_coef,
+            constraintes_coef=constraintes_coef,
+            constraintes_inequality=constraintes_inequality,
+            maximize=maximize,
+            variable_types=variable_types,
+            lower_bounds=lower_bounds,
+            upper_bounds=upper_bounds,
+            backend=backend,
+            threads=threads,
+            time_limit=time_limit,
+            gap_rel=gap_rel
+        )
+
+        return result["variables"]
+
+    result = lp_solve_detailed(
+        decision_vars=decision_vars,
+        decision_vars_coef=decision_vars_coef,
+        constraintes_coef=constraintes_coef,
+        constraintes_inequality=constraintes_inequality,
+        maximize=maximize,
+        backend=backend,
+        ranging=False,
+        presolve=presolve,
+        lower_bounds=lower_bounds,
+        upper_bounds=upper_bounds
+    )
+
+    return result["variables"]
 
 
 def lp_maximize_from_csv(
     path: str,
     objective_col: str,
-    decision_var_col: str
+    decision_var_col: str,
+    backend: str = "auto"
 ) -> dict[str, float]:
     data = lp_extract_data_from_csv(path, objective_col, decision_var_col)
 
@@ -102,12 +1254,14 @@ def lp_maximize_from_csv(
         constraintes_coef=data["constraintes_coef"],
         constraintes_inequality=data["constraintes_inequality"],
         maximize=True,
+        backend=backend,
     )
 
 def lp_minimize_from_csv(
     path: str,
     objective_col: str,
-    decision_var_col: str
+    decision_var_col: str,
+    backend: str = "auto"
 ) -> dict[str, float]:
     data = lp_extract_data_from_csv(path, objective_col, decision_var_col)
 
@@ -117,4 +1271,155 @@ def lp_minimize_from_csv(
         constraintes_coef=data["constraintes_coef"],
         constraintes_inequality=data["constraintes_inequality"],
         maximize=False,
-    )
\ No newline at end of file
+        backend=backend,
+    )
+
+
+def _lp_solve_scenario_chunk(
+    decision_vars: list[str],
+    constraint_matrix: sparse.csr_matrix,
+    objective_scenarios: np.ndarray,
+    rhs_scenarios: np.ndarray,
+    maximize: bool,
+    backend: str
+) -> list[tuple[str, float | None, list[float | None]]]:
+    # Runs in a worker process: solves a chunk of scenarios of the same model
+    results = []
+
+    if backend == "highs":
+        for objective_coef, constraint_bounds in zip(objective_scenarios, rhs_scenarios):
+            solution = _lp_solve_highs(decision_vars, objective_coef, constraint_matrix, constraint_bounds, maximize)
+            objective = float(objective_coef @ solution["x"]) if solution["status"] == "Optimal" else None
+            results.append((solution["status"], objective, solution["x"].tolist()))
+
+        return results
+
+    # CBC: the model is built once per chunk, then only its objective and limits change.
+    # Each solve starts from the previous scenario solution.
+    lp_prob, decision_variables = lp_build_model(
+        decision_vars, objective_scenarios[0], constraint_matrix, rhs_scenarios[0], maximize
+    )
+    constraints = list(lp_prob.constraints.values())
+    solver = PULP_CBC_CMD(msg=False, warmStart=True)
+
+    for objective_coef, constraint_bounds in zip(objective_scenarios, rhs_scenarios):
+        lp_prob.setObjective(LpAffineExpression(zip(decision_variables, objective_coef.tolist())))
+        for constraint, bound in zip(constraints, constraint_bounds.tolist()):
+            constraint.constant = -bound
+
+        lp_prob.solve(solver)
+        status = LpStatus[lp_prob.status]
+
+        # CBC leaves values on infeasible or unbounded scenarios: they are not results
+        if status != "Optimal":
+            results.append((status, None, [None] * len(decision_variables)))
+            continue
+
+        solution = [var.varValue for var in decision_variables]
+        results.append((status, value(lp_prob.objective), solution))
+
+        # Only an optimal solution is a warm start for the next scenario
+        for var in decision_variables:
+            if var.varValue is not None:
+                var.setInitialValue(var.varValue)
+
+    return results
+
+
+def lp_solve_scenarios(
+    decision_vars: list[str],
+    decision_vars_coef: list[float],
+    constraintes_coef: list[list[float]],
+    constraintes_inequality: list[float],
+    maximize: bool,
+    rhs_scenarios=None,
+    objective_scenarios=None,
+    backend: str = "auto",
+    max_workers: int | None = None,
+) -> pd.DataFrame:
+    if backend not in LP_BACKENDS:
+        raise ValueError(f"Unknown backend '{backend}', expected one of {LP_BACKENDS}.")
+
+    objective_coef, constraint_matrix, constraint_bounds = lp_prepare_arrays(
+        decision_vars, decision_vars_coef, constraintes_coef, constraintes_inequality
+    )
+    n_constraints, n_vars = constraint_matrix.shape
+
+    # Scenario matrices: one row per scenario, the base model fills the missing one
+    rhs = None if rhs_scenarios is None else np.atleast_2d(np.asarray(rhs_scenarios, dtype=float))
+    objectives = None if objective_scenarios is None else np.atleast_2d(np.asarray(objective_scenarios, dtype=float))
+
+    if rhs is None and objectives is None:
+        raise ValueError("At least one of the RHS or objective scenarios must be given.")
+    if rhs is not None and rhs.shape[1] != n_constraints:
+        raise ValueError(f"Each RHS scenario must have {n_constraints} values.")
+    if objectives is not None and objectives.shape[1] != n_vars:
+        raise ValueError(f"Each objective scenario must have {n_vars} values.")
+    if rhs is not None and objectives is not None and rhs.shape[0] != objectives.shape[0]:
+        raise ValueError("The RHS and objective scenarios must have the same number of rows.")
+
+    n_scenarios = (rhs if rhs is not None else objectives).shape[0]
+    if rhs is None:
+        rhs = np.broadcast_to(constraint_bounds, (n_scenarios, n_constraints))
+    if objectives is None:
+        objectives = np.broadcast_to(objective_coef, (n_scenarios, n_vars))
+
+    if backend == "auto":
+        backend = lp_select_backend(constraint_matrix)
+
+    # Split the scenarios in contiguous chunks, one task per worker
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = max(1, min(max_workers, n_scenarios))
+    chunks = np.array_split(np.arange(n_scenarios), max_workers)
+    tasks = [
+        (decision_vars, constraint_matrix, objectives[chunk], rhs[chunk], maximize, backend)
+        for chunk in chunks
+    ]
+
+    if max_workers == 1:
+        chunk_results = [_lp_solve_scenario_chunk(*task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            chunk_results = list(executor.map(_lp_solve_scenario_chunk, *zip(*tasks)))
+
+    results = [result for chunk_result in chunk_results for result in chunk_result]
+
+    # Tidy table: one row per scenario, same variable names as lp_solve
+    names = [str(name).translate(LpElement.trans) for name in decision_vars]
+    scenarios_table = pd.DataFrame(
+        [solution for _, _, solution in results],
+        columns=names,
+        dtype=float
+    )
+    scenarios_table.insert(0, "scenario", np.arange(n_scenarios))
+    scenarios_table.insert(1, "status", [status for status, _, _ in results])
+    scenarios_table.insert(2, "objective", pd.Series([objective for _, objective, _ in results], dtype=float))
+
+    return scenarios_table
+
+
+def lp_extract_scenarios_from_csv(
+    path: str,
+    ressources_headers: list[str],
+    decision_vars: list[str]
+) -> dict[str, np.ndarray | None]:
+    # One row per scenario: columns named after resources give the RHS,
+    # columns named after decision variables give the objective coefficients
+    data_frame = pd.read_csv(path)
+    data_frame.columns = [str(col).strip() for col in data_frame.columns]
+
+    rhs_columns = [col for col in ressources_headers if col in data_frame.columns]
+    objective_columns = [col for col in decision_vars if col in data_frame.columns]
+
+    if not rhs_columns and not objective_columns:
+        raise ValueError("The scenario file must have resource or decision variable columns.")
+    if rhs_columns and len(rhs_columns) != len(ressources_headers):
+        raise ValueError(f"The scenario file must give every resource: {ressources_headers}.")
+    if objective_columns and len(objective_columns) != len(decision_vars):
+        raise ValueError(f"The scenario file must give every decision variable: {decision_vars}.")
+
+    return {
+        "rhs_scenarios": data_frame[rhs_columns].to_numpy(dtype=float) if rhs_columns else None,
+        "objective_scenarios": data_frame[objective_columns].to_numpy(dtype=float) if objective_columns else None
+    }
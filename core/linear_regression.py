@@ -1,4 +1,6 @@
 import numpy as np
+import pandas as pd
+from scipy import linalg
 
 def linear_regression_compute(
     explicative_vars: list[float],
@@ -39,4 +41,398 @@ def linear_regression_compute(
     }
 
 
-    
\ No newline at end of file
+REGRESSION_METHODS = ["qr", "cholesky"]
+
+
+def linear_regression_compute_multiple(
+    explicative_vars,
+    tagert_vars,
+    intercept: bool = True,
+    method: str = "qr"
+) -> dict[str, np.ndarray | float]:
+    # Least squares of one or several targets (columns of Y) on the same explanatory
+    # columns (X): every target is solved with a single factorization of X
+    if method not in REGRESSION_METHODS:
+        raise ValueError(f"Unknown method '{method}', expected one of {REGRESSION_METHODS}.")
+
+    X = np.asarray(explicative_vars, dtype=np.float64)
+    Y = np.asarray(tagert_vars, dtype=np.float64)
+    if X.ndim == 1:
+        X = X[:, None]
+    single_target = Y.ndim == 1
+    if single_target:
+        Y = Y[:, None]
+
+    n_samples, n_features = X.shape
+    if Y.shape[0] != n_samples:
+        raise ValueError("X and Y must have the same number of rows.")
+    if n_samples < n_features + intercept:
+        raise ValueError("Not enough rows to estimate the coefficients.")
+
+    # The intercept is removed by centering, which also improves the conditioning
+    mean_X = X.mean(axis=0) if intercept else np.zeros(n_features)
+    mean_Y = Y.mean(axis=0) if intercept else np.zeros(Y.shape[1])
+    X_centered = X - mean_X
+    Y_centered = Y - mean_Y
+
+    if method == "qr":
+        Q, R = linalg.qr(X_centered, mode="economic")
+        diagonal = np.abs(np.diag(R))
+        if diagonal.min() <= np.finfo(np.float64).eps * max(n_samples, n_features) * diagonal.max():
+            raise ValueError("The explanatory columns are collinear → cannot compute regression.")
+        coefficients = linalg.solve_triangular(R, Q.T @ Y_centered)
+    else:
+        # Normal equations: faster for tall X, but squares the condition number
+        try:
+            factor = linalg.cho_factor(X_centered.T @ X_centered)
+        except linalg.LinAlgError:
+            factor = None
+        # X^T X only resolves the columns of X down to sqrt(eps)
+        diagonal = np.abs(np.diag(factor[0])) if factor is not None else np.zeros(1)
+        if diagonal.min() <= np.sqrt(np.finfo(np.float64).eps) * diagonal.max():
+            raise ValueError("The explanatory columns are collinear → cannot compute regression.")
+        coefficients = linalg.cho_solve(factor, X_centered.T @ Y_centered)
+
+    intercepts = mean_Y - mean_X @ coefficients
+
+    # Coefficient of determination of each target
+    residuals = Y_centered - X_centered @ coefficients
+    residual_sum_of_squares = np.einsum("ij,ij->j", residuals, residuals)
+    total_sum_of_squares = np.einsum("ij,ij->j", Y_centered, Y_centered) if intercept else np.einsum("ij,ij->j", Y, Y)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r2 = 1.0 - residual_sum_of_squares / total_sum_of_squares
+
+    if single_target:
+        return {
+            "coefficients": coefficients[:, 0],
+            "intercept": float(intercepts[0]),
+            "r2": float(r2[0]),
+            "residual_sum_of_squares": float(residual_sum_of_squares[0])
+        }
+
+    return {
+        "coefficients": coefficients,
+        "intercept": intercepts,
+        "r2": r2,
+        "residual_sum_of_squares": residual_sum_of_squares
+    }
+
+
+def linear_regression_compute_grouped(
+    group_keys,
+    explicative_vars,
+    tagert_vars
+) -> pd.DataFrame:
+    # One simple regression per group key, all groups at once: rows are sorted by key
+    # once, then every per-group sum is a segmented reduction over contiguous slices
+    X = np.asarray(explicative_vars, dtype=np.float64).ravel()
+    Y = np.asarray(tagert_vars, dtype=np.float64).ravel()
+
+    if X.size != Y.size or len(group_keys) != X.size:
+        raise ValueError("The group keys, X and Y must have the same size.")
+
+    # Rows without a key (code -1) are dropped
+    codes, groups = pd.factorize(np.asarray(group_keys), sort=True)
+    order = np.argsort(codes, kind="stable")
+    order = order[codes[order] >= 0]
+    if order.size == 0:
+        raise ValueError("No data → cannot compute regression.")
+
+    codes = codes[order]
+    X = X[order]
+    Y = Y[order]
+
+    starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+    counts = np.diff(np.r_[starts, codes.size])
+
+    # Two passes: group means first, then sums of deviations around them
+    mean_X = np.add.reduceat(X, starts) / counts
+    mean_Y = np.add.reduceat(Y, starts) / counts
+    deviation_X = X - np.repeat(mean_X, counts)
+    deviation_Y = Y - np.repeat(mean_Y, counts)
+
+    variance_X = np.add.reduceat(deviation_X * deviation_X, starts)
+    variance_Y = np.add.reduceat(deviation_Y * deviation_Y, starts)
+    covariance_X_Y = np.add.reduceat(deviation_X * deviation_Y, starts)
+
+    # Groups with a constant X get NaN instead of stopping the whole computation
+    with np.errstate(divide="ignore", invalid="ignore"):
+        a = np.where(variance_X > 0, covariance_X_Y / variance_X, np.nan)
+        b = mean_Y - a * mean_X
+        correlation = covariance_X_Y / np.sqrt(variance_X * variance_Y)
+
+    return pd.DataFrame({
+        "group": groups[codes[starts]],
+        "n": counts,
+        "a": a,
+        "b": b,
+        "correlation": correlation
+    })
+
+
+# Memory used by one chunk of resamples (indices and resampled X, Y and deviations)
+RESAMPLING_MEMORY_BYTES = 64 * 1024 ** 2
+
+
+def _regression_samples(
+    explicative_vars,
+    tagert_vars
+) -> tuple[np.ndarray, np.ndarray]:
+    X = np.asarray(explicative_vars, dtype=np.float64).ravel()
+    Y = np.asarray(tagert_vars, dtype=np.float64).ravel()
+
+    if X.size != Y.size:
+        raise ValueError("X and Y must have the same size.")
+    if X.size < 3:
+        raise ValueError("At least 3 points are needed to resample a regression.")
+
+    return X, Y
+
+
+def _resampling_chunks(n_resamples: int, n_samples: int, memory_limit: int) -> list[int]:
+    # Number of resamples per chunk, so that a chunk stays within the memory budget
+    chunk_size = max(1, memory_limit // (5 * 8 * n_samples))
+
+    return [min(chunk_size, n_resamples - start) for start in range(0, n_resamples, chunk_size)]
+
+
+def linear_regression_bootstrap(
+    explicative_vars,
+    tagert_vars,
+    n_resamples: int = 2000,
+    confidence: float = 0.95,
+    seed: int | np.random.Generator | None = None,
+    memory_limit: int = RESAMPLING_MEMORY_BYTES
+) -> dict[str, tuple[float, float] | int]:
+    # Percentile bootstrap intervals of a, b and the correlation. Each chunk draws its
+    # resample indices as one (chunk, n) integer matrix and fits every replicate at once.
+    # The random stream does not depend on the chunk size: a seed gives the same intervals
+    # whatever the memory budget.
+    X, Y = _regression_samples(explicative_vars, tagert_vars)
+    if n_resamples < 1:
+        raise ValueError("The number of resamples must be at least 1.")
+    if not 0 < confidence < 1:
+        raise ValueError("The confidence level must be between 0 and 1.")
+
+    rng = np.random.default_rng(seed)
+    replicates = {"a": [], "b": [], "correlation": []}
+
+    for chunk_size in _resampling_chunks(n_resamples, X.size, memory_limit):
+        indices = rng.integers(0, X.size, size=(chunk_size, X.size))
+        X_resampled = X[indices]
+        Y_resampled = Y[indices]
+
+        mean_X = X_resampled.mean(axis=1)
+        mean_Y = Y_resampled.mean(axis=1)
+        X_resampled -= mean_X[:, None]
+        Y_resampled -= mean_Y[:, None]
+
+        variance_X = np.einsum("ij,ij->i", X_resampled, X_resampled)
+        variance_Y = np.einsum("ij,ij->i", Y_resampled, Y_resampled)
+        covariance_X_Y = np.einsum("ij,ij->i", X_resampled, Y_resampled)
+
+        # Replicates drawing a single distinct X value have no slope (NaN, then ignored)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            a = covariance_X_Y / np.where(variance_X > 0, variance_X, np.nan)
+            replicates["a"].append(a)
+            replicates["b"].append(mean_Y - a * mean_X)
+            replicates["correlation"].append(covariance_X_Y / np.sqrt(variance_X * variance_Y))
+
+    alpha = (1 - confidence) / 2
+    result = {}
+    for name, values in replicates.items():
+        lower, upper = np.nanquantile(np.concatenate(values), [alpha, 1 - alpha])
+        result[name] = (float(lower), float(upper))
+    result["n_resamples"] = n_resamples
+
+    return result
+
+
+def linear_regression_permutation_test(
+    explicative_vars,
+    tagert_vars,
+    n_permutations: int = 2000,
+    seed: int | np.random.Generator | None = None,
+    memory_limit: int = RESAMPLING_MEMORY_BYTES
+) -> dict[str, float | int]:
+    # Two-sided test of "no correlation": Y is shuffled against X, one chunk of
+    # permutations at a time. Permuting Y leaves both variances unchanged, so only
+    # the covariance is computed for each permutation.
+    X, Y = _regression_samples(explicative_vars, tagert_vars)
+    if n_permutations < 1:
+        raise ValueError("The number of permutations must be at least 1.")
+
+    deviation_X = X - X.mean()
+    deviation_Y = Y - Y.mean()
+    scale = np.sqrt((deviation_X @ deviation_X) * (deviation_Y @ deviation_Y))
+    if scale == 0:
+        raise ValueError("Variance of X or Y is zero → cannot test the correlation.")
+
+    correlation = (deviation_X @ deviation_Y) / scale
+
+    rng = np.random.default_rng(seed)
+    exceed = 0
+    for chunk_size in _resampling_chunks(n_permutations, X.size, memory_limit):
+        permuted_Y = rng.permuted(np.broadcast_to(deviation_Y, (chunk_size, Y.size)), axis=1)
+        permuted_correlation = (permuted_Y @ deviation_X) / scale
+        exceed += int(np.count_nonzero(np.abs(permuted_correlation) >= abs(correlation) - 1e-12))
+
+    return {
+        "correlation": float(correlation),
+        "p_value": (exceed + 1) / (n_permutations + 1),
+        "n_permutations": n_permutations
+    }
+
+
+class RegressionStatistics:
+    # Running sufficient statistics of a simple regression: count, means, sums of squared
+    # deviations and co-deviation. Single points are added or removed in O(1) with Welford's
+    # update; batches are combined with Chan's parallel update, so statistics of separate
+    # chunks (or processes) can be merged without losing precision.
+
+    def __init__(self) -> None:
+        self.n = 0
+        self.mean_X = 0.0
+        self.mean_Y = 0.0
+        self.m2_X = 0.0
+        self.m2_Y = 0.0
+        self.c_XY = 0.0
+
+    def _combine(
+        self,
+        n: int,
+        mean_X: float,
+        mean_Y: float,
+        m2_X: float,
+        m2_Y: float,
+        c_XY: float
+    ) -> None:
+        if n == 0:
+            return
+
+        total = self.n + n
+        delta_X = mean_X - self.mean_X
+        delta_Y = mean_Y - self.mean_Y
+        weight = self.n * n / total
+
+        self.mean_X += delta_X * n / total
+        self.mean_Y += delta_Y * n / total
+        self.m2_X += m2_X + delta_X * delta_X * weight
+        self.m2_Y += m2_Y + delta_Y * delta_Y * weight
+        self.c_XY += c_XY + delta_X * delta_Y * weight
+        self.n = total
+
+    def add(self, x: float, y: float) -> "RegressionStatistics":
+        self.n += 1
+        delta_X = x - self.mean_X
+        delta_Y = y - self.mean_Y
+        self.mean_X += delta_X / self.n
+        self.mean_Y += delta_Y / self.n
+
+        # Deviations before and after the update: no cancellation between large sums
+        self.m2_X += delta_X * (x - self.mean_X)
+        self.m2_Y += delta_Y * (y - self.mean_Y)
+        self.c_XY += delta_X * (y - self.mean_Y)
+
+        return self
+
+    def remove(self, x: float, y: float) -> "RegressionStatistics":
+        # Exact inverse of add (the point must have been added before)
+        if self.n == 0:
+            raise ValueError("No data → cannot remove a point.")
+        if self.n == 1:
+            self.__init__()
+            return self
+
+        self.n -= 1
+        old_mean_X = self.mean_X
+        old_mean_Y = self.mean_Y
+        self.mean_X -= (x - self.mean_X) / self.n
+        self.mean_Y -= (y - self.mean_Y) / self.n
+
+        # Rounding must not make a sum of squares negative
+        self.m2_X = max(self.m2_X - (x - self.mean_X) * (x - old_mean_X), 0.0)
+        self.m2_Y = max(self.m2_Y - (y - self.mean_Y) * (y - old_mean_Y), 0.0)
+        self.c_XY -= (x - self.mean_X) * (y - old_mean_Y)
+
+        return self
+
+    def update(self, explicative_vars, tagert_vars) -> "RegressionStatistics":
+        X = np.asarray(explicative_vars, dtype=np.float64).ravel()
+        Y = np.asarray(tagert_vars, dtype=np.float64).ravel()
+
+        if X.size != Y.size:
+            raise ValueError("X and Y must have the same size.")
+        if X.size == 0:
+            return self
+
+        # Two-pass statistics inside the batch, then one merge into the running ones
+        mean_X = X.mean()
+        mean_Y = Y.mean()
+        deviation_X = X - mean_X
+        deviation_Y = Y - mean_Y
+
+        self._combine(
+            X.size, mean_X, mean_Y,
+            deviation_X @ deviation_X, deviation_Y @ deviation_Y, deviation_X @ deviation_Y
+        )
+
+        return self
+
+    def merge(self, other: "RegressionStatistics") -> "RegressionStatistics":
+        self._combine(other.n, other.mean_X, other.mean_Y, other.m2_X, other.m2_Y, other.c_XY)
+
+        return self
+
+    def to_dict(self) -> dict[str, float | int]:
+        return {
+            "n": self.n,
+            "mean_X": self.mean_X,
+            "mean_Y": self.mean_Y,
+            "m2_X": self.m2_X,
+            "m2_Y": self.m2_Y,
+            "c_XY": self.c_XY
+        }
+
+    @classmethod
+    def from_dict(cls, state: dict[str, float | int]) -> "RegressionStatistics":
+        statistics = cls()
+        statistics.n = int(state["n"])
+        for name in ("mean_X", "mean_Y", "m2_X", "m2_Y", "c_XY"):
+            setattr(statistics, name, float(state[name]))
+
+        return statistics
+
+    def result(self) -> dict[str, float]:
+        if self.n == 0:
+            raise ValueError("No data → cannot compute regression.")
+        if self.m2_X == 0:
+            raise ValueError("Variance of X is zero → cannot compute regression.")
+
+        a = self.c_XY / self.m2_X
+        b = self.mean_Y - a * self.mean_X
+        correlation = self.c_XY / np.sqrt(self.m2_X * self.m2_Y)
+
+        return {
+            "a": float(a),
+            "b": float(b),
+            "correlation": float(correlation),
+            "n": self.n
+        }
+
+
+def linear_regression_compute_from_csv(
+    path,
+    explicative_col: str,
+    target_col: str,
+    chunksize: int = 1_000_000
+) -> dict[str, float]:
+    # One read of the file, in chunks: memory use only depends on the chunk size.
+    # Rows with a missing X or Y are skipped.
+    statistics = RegressionStatistics()
+
+    for chunk in pd.read_csv(path, usecols=[explicative_col, target_col], chunksize=chunksize):
+        chunk = chunk.dropna()
+        statistics.update(chunk[explicative_col].to_numpy(), chunk[target_col].to_numpy())
+
+    return statistics.result()
@@ -1,28 +1,626 @@
-from numpy import array, isclose, linalg
+import hashlib
+import os
+import tempfile
+import warnings
+
+import numpy as np
+import pandas as pd
+from scipy import io, linalg, sparse
+from scipy.sparse import linalg as sparse_linalg
+
+from core.cache import LRUCache
+
+def _prepare_linear_systems(
+    coefficient_matrices: np.ndarray,
+    ordinate_matrices: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, tuple[int, ...]]:
+    # Bring every input to a (k, n, n) stack and a (k, n, m) right-hand side stack,
+    # and remember the output shape expected by the caller
+    A = np.asarray(coefficient_matrices, dtype=float)
+    B = np.asarray(ordinate_matrices, dtype=float)
+
+    if A.ndim not in (2, 3) or A.shape[-1] != A.shape[-2]:
+        raise ValueError("The coefficient matrix must be square, or a stack of square matrices of shape (k, n, n).")
+
+    n = A.shape[-1]
+    single_system = A.ndim == 2
+    A_stack = A[np.newaxis] if single_system else A
+    k = A_stack.shape[0]
+
+    if single_system:
+        # b : (n,) or (n, m)
+        if B.ndim not in (1, 2) or B.shape[0] != n:
+            raise ValueError(f"The ordinate matrix must have shape ({n},) or ({n}, m).")
+        output_shape = B.shape
+        B_stack = B.reshape(1, n, -1)
+    else:
+        # b : (n,) shared by every system, (k, n) or (k, n, m)
+        if B.ndim == 1 and B.shape[0] == n:
+            output_shape = (k, n)
+            B_stack = np.broadcast_to(B.reshape(1, n, 1), (k, n, 1))
+        elif B.ndim == 2 and B.shape == (k, n):
+            output_shape = B.shape
+            B_stack = B.reshape(k, n, 1)
+        elif B.ndim == 3 and B.shape[:2] == (k, n):
+            output_shape = B.shape
+            B_stack = B
+        else:
+            raise ValueError(f"The ordinate matrices must have shape ({n},), ({k}, {n}) or ({k}, {n}, m).")
+
+    return A_stack, B_stack, output_shape
+
+
+# Systems whose estimated reciprocal condition number is less than this factor above
+# rcond get an exact condition number
+BORDERLINE_CONDITION_FACTOR = 1000
+
+
+def solve_linear_systems(
+    coefficient_matrices: np.ndarray,
+    ordinate_matrices: np.ndarray,
+    rcond: float | None = None
+) -> dict[str, np.ndarray]:
+    A, B, output_shape = _prepare_linear_systems(coefficient_matrices, ordinate_matrices)
+    k, n, _ = A.shape
+
+    if rcond is None:
+        rcond = n * np.finfo(float).eps
+
+    solutions = np.full(B.shape, np.nan)
+    probe_solutions = np.full((k, n, 2), np.nan)
+
+    # ||A^-1||_1 is estimated from a few fixed probe vectors v, solved along with B in the
+    # same gesv call (O(n²) each on top of the factorization): ||A^-1 v||_1 / ||v||_1 is a
+    # lower bound. The probes are the alternating sign vector of the Hager / Higham
+    # estimator (LAPACK lacn2) and a fixed random sign vector.
+    index = np.arange(n)
+    probes = np.column_stack([
+        (-1.0) ** index * (1 + index / max(n - 1, 1)),
+        np.random.default_rng(0).choice([-1.0, 1.0], size=n)
+    ])
+    rhs = np.concatenate([B, np.broadcast_to(probes, (k, n, probes.shape[1]))], axis=2)
+    m = B.shape[2]
+
+    # An exact zero pivot makes the whole stack fail: those systems (zero LU determinant
+    # sign) are set aside and the others solved in a single call again
+    solvable = np.ones(k, dtype=bool)
+    try:
+        results = np.linalg.solve(A, rhs)
+    except np.linalg.LinAlgError:
+        solvable = np.linalg.slogdet(A)[0] != 0
+        results = np.linalg.solve(A[solvable], rhs[solvable])
+
+    solutions[solvable] = results[..., :m]
+    probe_solutions[solvable] = results[..., m:]
+
+    # Reciprocal condition number 1 / (||A||_1 ||A^-1||_1), with the estimate of ||A^-1||_1
+    # (column sums with einsum: a reduction over axis 1 of a small matrix stack is much slower)
+    norm_A = np.einsum("kij->kj", np.abs(A)).max(axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        norm_inverse = (np.einsum("kij->kj", np.abs(probe_solutions)) / np.abs(probes).sum(axis=0)).max(axis=1)
+        reciprocal_condition = 1.0 / (norm_A * norm_inverse)
+
+        # The probes may underestimate ||A^-1||_1: near the threshold the exact norm is
+        # computed, for those systems only
+        borderline = np.flatnonzero(solvable & (reciprocal_condition < rcond * BORDERLINE_CONDITION_FACTOR))
+        if borderline.size:
+            inverses = np.linalg.inv(A[borderline])
+            reciprocal_condition[borderline] = 1.0 / (norm_A[borderline] * np.einsum("kij->kj", np.abs(inverses)).max(axis=1))
+
+    singular = ~solvable | ~(reciprocal_condition >= rcond) | ~np.all(np.isfinite(solutions), axis=(1, 2))
+    solutions[singular] = np.nan
+
+    return {
+        "solutions": solutions.reshape(output_shape),
+        "singular": singular
+    }
+
+
+class LUFactorization:
+    # LU factorization with partial pivoting (P A = L U) of a square coefficient matrix.
+    # Once built, every solve only costs two O(n²) triangular solves.
+
+    def __init__(self, coefficient_matrix: np.ndarray, rcond: float | None = None) -> None:
+        A = np.asarray(coefficient_matrix, dtype=float)
+
+        if A.ndim != 2 or A.shape[0] != A.shape[1]:
+            raise ValueError("The coefficient matrix must be square.")
+
+        self.size = A.shape[0]
+        # An exact zero pivot is reported through rcond below, not as a warning
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", linalg.LinAlgWarning)
+            self.lu, self.piv = linalg.lu_factor(A, check_finite=True)
+
+        # Reciprocal condition number estimate (LAPACK gecon), O(n²) on top of the factorization
+        anorm = np.linalg.norm(A, ord=1)
+        if anorm == 0:
+            self.rcond = 0.0
+        else:
+            gecon, = linalg.get_lapack_funcs(("gecon",), (self.lu,))
+            self.rcond = float(gecon(self.lu, anorm, norm="1")[0])
+
+        if rcond is None:
+            rcond = self.size * np.finfo(float).eps
+        self.singular = self.rcond < rcond
+
+    @property
+    def nbytes(self) -> int:
+        return self.lu.nbytes + self.piv.nbytes
+
+    def solve(self, ordinate_matrix: np.ndarray) -> np.ndarray:
+        if self.singular:
+            raise ValueError("The coefficient matrix is singular.")
+
+        B = np.asarray(ordinate_matrix, dtype=float)
+        if B.shape[0] != self.size:
+            raise ValueError(f"The ordinate matrix must have {self.size} rows.")
+
+        return linalg.lu_solve((self.lu, self.piv), B, check_finite=False)
+
+
+# Factorizations already computed, keyed by the content of the coefficient matrix
+_lu_cache = LRUCache(max_bytes=256 * 1024**2, sizeof=lambda factorization: factorization.nbytes)
+
+
+def _matrix_key(matrix: np.ndarray) -> str:
+    matrix = np.ascontiguousarray(matrix, dtype=float)
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(str(matrix.shape).encode())
+    digest.update(matrix.tobytes())
+
+    return digest.hexdigest()
+
+
+def lu_factorize(coefficient_matrix: np.ndarray) -> LUFactorization:
+    A = np.asarray(coefficient_matrix, dtype=float)
+    key = _matrix_key(A)
+
+    factorization = _lu_cache.get(key)
+    if factorization is None:
+        factorization = LUFactorization(A)
+        _lu_cache.put(key, factorization)
+
+    return factorization
+
+
+def lu_cache_stats() -> dict[str, int]:
+    return _lu_cache.stats()
+
+
+def lu_cache_clear() -> None:
+    _lu_cache.clear()
+
+
+def lu_cache_resize(max_bytes: int) -> None:
+    _lu_cache.resize(max_bytes)
+
+
+def solve_linear_system_cached(
+    coefficient_matrix: np.ndarray,
+    ordinate_matrix: np.ndarray
+) -> np.ndarray | None:
+    factorization = lu_factorize(coefficient_matrix)
+
+    # If the coefficient matrix is singular
+    # the linear system solution is undetermined
+    if factorization.singular:
+        return None
+
+    return factorization.solve(ordinate_matrix)
+
 
 def solve_linear_system(
-    coefficient_matrix: list[list[float]], 
+    coefficient_matrix: list[list[float]],
     ordinate_matrix: list[float]
 ) -> list[float] | None:
-    
-    # Converte given arrays to a numpy arrays
-    np_coefficient_matrix = array(coefficient_matrix, dtype=float)
-    np_ordinate_matrix = array(ordinate_matrix, dtype=float)
-
-    # Calculate coefficient matrix determinant
-    coefficient_matrix_determinant: float = linalg.det(np_coefficient_matrix)    
+    solution = solve_linear_system_cached(coefficient_matrix, ordinate_matrix)
 
-    # If coefficient matrix determinant is equal to 0
-    # the linear system solution is undetermined
-    if isclose(coefficient_matrix_determinant, 0.0):
+    if solution is None:
         return None
-    
-    # Solve the linear system and return results as python list
-    solution = linalg.solve(np_coefficient_matrix, np_ordinate_matrix).tolist()
 
     # Round each value to 3 decimal places and convert numpy types to native floats
-    return [float(round(x, 3)) for x in solution]
-    
-    
+    return [float(x) for x in np.round(solution, 3)]
+
+
+
+def solve_linear_system_mixed_precision(
+    coefficient_matrix: np.ndarray,
+    ordinate_matrix: np.ndarray,
+    tolerance: float | None = None,
+    max_refinements: int = 10
+) -> dict:
+    A = np.asarray(coefficient_matrix, dtype=np.float64)
+    b = np.asarray(ordinate_matrix, dtype=np.float64)
+
+    if A.ndim != 2 or A.shape[0] != A.shape[1]:
+        raise ValueError("The coefficient matrix must be square.")
+    if b.shape[0] != A.shape[0]:
+        raise ValueError(f"The matrix A has {A.shape[0]} rows but the vector b has {b.shape[0]} elements.")
+
+    n = A.shape[0]
+    norm_A = np.linalg.norm(A, ord=np.inf)
+    norm_b = np.max(np.abs(b), initial=0.0)
+
+    # Same stopping criterion as LAPACK dsgesv: ||r|| <= ||A|| ||x|| eps sqrt(n)
+    if tolerance is None:
+        tolerance = np.finfo(np.float64).eps * np.sqrt(n)
+
+    def backward_error(x: np.ndarray, r: np.ndarray) -> float:
+        denominator = norm_A * np.max(np.abs(x), initial=0.0) + norm_b
+        return float(np.max(np.abs(r), initial=0.0) / denominator) if denominator > 0 else 0.0
+
+    refinement_steps = 0
+    converged = False
+    condition_estimate = np.inf
+
+    # Factorize in single precision: half the memory traffic of a float64 factorization.
+    # Entries beyond the float32 range overflow in the cast: such a matrix goes straight
+    # to the double precision solve.
+    with np.errstate(over="ignore"):
+        A32 = A.astype(np.float32)
+
+    if np.all(np.isfinite(A32)):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", linalg.LinAlgWarning)
+            lu32, piv32 = linalg.lu_factor(A32, check_finite=False)
+
+        gecon, = linalg.get_lapack_funcs(("gecon",), (lu32,))
+        rcond = float(gecon(lu32, np.linalg.norm(A32, ord=1), norm="1")[0]) if norm_A > 0 else 0.0
+        condition_estimate = 1.0 / rcond if rcond > 0 else np.inf
+
+    # Refinement can only converge when cond(A) * eps(float32) < 1
+    if condition_estimate * np.finfo(np.float32).eps < 1:
+        # Residuals beyond the float32 range give non finite corrections, caught below
+        with np.errstate(over="ignore", invalid="ignore"):
+            x = linalg.lu_solve((lu32, piv32), b.astype(np.float32), check_finite=False).astype(np.float64)
+            r = b - A @ x
+            error = backward_error(x, r)
+
+            while error > tolerance and refinement_steps < max_refinements:
+                # Correction computed with the float32 factors, residual accumulated in float64
+                d = linalg.lu_solve((lu32, piv32), r.astype(np.float32), check_finite=False)
+                x += d.astype(np.float64)
+                r = b - A @ x
+                refinement_steps += 1
+
+                previous_error, error = error, backward_error(x, r)
+                # Stagnation: the refinement will not reach the target
+                if error > 0.5 * previous_error:
+                    break
+
+        converged = bool(np.all(np.isfinite(x)) and error <= tolerance)
+
+    # Fall back to a full double precision solve
+    if not converged:
+        factorization = lu_factorize(A)
+        if factorization.singular:
+            raise ValueError("The coefficient matrix is singular.")
+
+        x = factorization.solve(b)
+        error = backward_error(x, b - A @ x)
+        condition_estimate = 1.0 / factorization.rcond
+
+    return {
+        "solution": x,
+        "precision": "float32" if converged else "float64",
+        "refinement_steps": refinement_steps,
+        "backward_error": error,
+        "condition_estimate": float(condition_estimate),
+        "converged": converged
+    }
+
+ITERATIVE_METHODS = ["auto", "cg", "gmres", "bicgstab"]
+PRECONDITIONERS = [None, "jacobi", "ilu"]
+
+
+def load_sparse_matrix(source) -> sparse.csr_matrix:
+    # Matrix Market files carry their own header
+    name = getattr(source, "name", source)
+    if isinstance(name, str) and name.endswith(".mtx"):
+        return sparse.csr_matrix(io.mmread(source))
+
+    # Coordinate format: one "row col value" triplet per line, 0-based indices
+    separator = "," if isinstance(name, str) and name.endswith(".csv") else r"\s+"
+    triplets = pd.read_csv(
+        source,
+        sep=separator,
+        header=None,
+        names=["row", "col", "value"],
+        comment="#",
+        dtype={"row": np.int64, "col": np.int64, "value": np.float64}
+    )
+
+    if (triplets[["row", "col"]].to_numpy() < 0).any():
+        raise ValueError("Row and column indices must be non-negative (0-based).")
+
+    rows = triplets["row"].to_numpy()
+    cols = triplets["col"].to_numpy()
+    size = int(max(rows.max(), cols.max())) + 1 if len(triplets) else 0
+
+    # Duplicated coordinates are summed, as in the COO convention
+    return sparse.coo_matrix((triplets["value"].to_numpy(), (rows, cols)), shape=(size, size)).tocsr()
+
+
+def load_vector(source) -> np.ndarray:
+    # One value per line (or separated by commas / spaces)
+    values = pd.read_csv(source, sep=r"[,\s]+", header=None, comment="#", engine="python")
+
+    return values.to_numpy(dtype=float).ravel()
+
+
+def _build_preconditioner(
+    A: sparse.csr_matrix,
+    preconditioner: str | None
+) -> sparse_linalg.LinearOperator | None:
+    if preconditioner is None:
+        return None
+
+    if preconditioner == "jacobi":
+        diagonal = A.diagonal()
+        if np.any(diagonal == 0):
+            raise ValueError("The Jacobi preconditioner needs a diagonal without zeros.")
+
+        inverse_diagonal = 1.0 / diagonal
+        return sparse_linalg.LinearOperator(A.shape, matvec=lambda x: inverse_diagonal * x)
+
+    if preconditioner == "ilu":
+        incomplete_lu = sparse_linalg.spilu(A.tocsc(), drop_tol=1e-4, fill_factor=10)
+        return sparse_linalg.LinearOperator(A.shape, matvec=incomplete_lu.solve)
+
+    raise ValueError(f"Unknown preconditioner '{preconditioner}', expected one of {PRECONDITIONERS}.")
+
+
+def _is_symmetric_positive_diagonal(A: sparse.csr_matrix) -> bool:
+    # Cheap necessary conditions for a symmetric positive definite matrix
+    if np.any(A.diagonal() <= 0):
+        return False
+
+    asymmetry = abs(A - A.T)
+    return asymmetry.nnz == 0 or asymmetry.max() <= 1e-12 * abs(A).max()
+
+
+def solve_sparse_linear_system(
+    coefficient_matrix,
+    ordinate_matrix: np.ndarray,
+    method: str = "auto",
+    preconditioner: str | None = "jacobi",
+    tolerance: float = 1e-8,
+    max_iterations: int | None = None
+) -> dict:
+    A = sparse.csr_matrix(coefficient_matrix, dtype=float)
+    b = np.asarray(ordinate_matrix, dtype=float).ravel()
+
+    if A.shape[0] != A.shape[1]:
+        raise ValueError("The coefficient matrix must be square.")
+    if A.shape[0] != b.size:
+        raise ValueError(f"The matrix A has {A.shape[0]} rows but the vector b has {b.size} elements.")
+    if method not in ITERATIVE_METHODS:
+        raise ValueError(f"Unknown method '{method}', expected one of {ITERATIVE_METHODS}.")
+
+    n = A.shape[0]
+    if max_iterations is None:
+        max_iterations = 10 * n
+
+    # Conjugate gradient only applies to symmetric positive definite matrices
+    if method == "auto":
+        method = "cg" if _is_symmetric_positive_diagonal(A) else "gmres"
+
+    M = _build_preconditioner(A, preconditioner)
+
+    iterations = 0
+    def count_iteration(_) -> None:
+        nonlocal iterations
+        iterations += 1
+
+    if method == "cg":
+        solution, info = sparse_linalg.cg(A, b, rtol=tolerance, maxiter=max_iterations, M=M, callback=count_iteration)
+    elif method == "bicgstab":
+        # bicgstab can converge on the half step of an iteration and return without calling back:
+        # that last iteration is counted when the solution moved past the last iterate seen
+        last_iterate = np.zeros(n)
+        def count_bicgstab_iteration(x: np.ndarray) -> None:
+            count_iteration(x)
+            last_iterate[:] = x
+
+        solution, info = sparse_linalg.bicgstab(
+            A, b, rtol=tolerance, maxiter=max_iterations, M=M, callback=count_bicgstab_iteration
+        )
+        if info == 0 and not np.array_equal(solution, last_iterate):
+            iterations += 1
+    else:
+        # gmres counts restart cycles in maxiter, the callback counts inner iterations
+        restart = min(n, 50)
+        solution, info = sparse_linalg.gmres(
+            A, b,
+            rtol=tolerance,
+            restart=restart,
+            maxiter=-(-max_iterations // restart),
+            M=M,
+            callback=count_iteration,
+            callback_type="pr_norm"
+        )
+
+    if info < 0:
+        raise ValueError(f"The {method} solver broke down (illegal input or breakdown).")
+
+    # Relative residual ||b - A x|| / ||b||
+    norm_b = np.linalg.norm(b)
+    residual = np.linalg.norm(b - A @ solution) / (norm_b if norm_b > 0 else 1.0)
+
+    return {
+        "solution": solution,
+        "method": method,
+        "iterations": iterations,
+        "residual": float(residual),
+        "converged": info == 0
+    }
+
+
+def load_dense_matrix(
+    path: str,
+    shape: tuple[int, ...] | None = None,
+    dtype: str = "float64",
+    offset: int = 0
+) -> np.ndarray:
+    # Memory-map the file: the data is read from disk on access, never copied as a whole
+    if path.endswith(".npy"):
+        return np.load(path, mmap_mode="r")
+
+    # Raw binary file: the shape can not be read from the file itself
+    if shape is None:
+        raise ValueError("The shape of a raw binary matrix must be given.")
+
+    return np.memmap(path, dtype=dtype, mode="r", shape=shape, offset=offset)
+
+
+class OutOfCoreLUFactorization:
+    # Blocked left-looking LU factorization with partial pivoting for matrices bigger than RAM.
+    # A is first copied, in row blocks, into a column-major memory-mapped file where it is
+    # factorized in place, so every column panel (n x block_size) is a contiguous read.
+
+    def __init__(
+        self,
+        coefficient_matrix: np.ndarray,
+        storage_path: str,
+        memory_limit: int = 256 * 1024**2
+    ) -> None:
+        A = coefficient_matrix
+
+        if A.ndim != 2 or A.shape[0] != A.shape[1]:
+            raise ValueError("The coefficient matrix must be square.")
+
+        n = A.shape[0]
+        self.size = n
+        self.storage_path = storage_path
+
+        # Peak memory: the current panel, a second one (a previous panel read back, or the
+        # copy factorized by LAPACK) and the temporaries of the row chunk updates (3 chunks
+        # of n / 4 rows), i.e. less than three panels
+        self.block_size = int(min(n, max(1, memory_limit // (3 * 8 * n))))
+        w = self.block_size
+        chunk_rows = max(1, n // 4)
+
+        self.factors = np.memmap(storage_path, dtype=np.float64, mode="w+", shape=(n, n), order="F")
+
+        # Stage A column-major: a C-order file is read in contiguous row blocks, each one
+        # within the memory limit, instead of scanning the whole file for every panel
+        block_rows = int(max(1, memory_limit // (8 * n)))
+        for r0 in range(0, n, block_rows):
+            r1 = min(r0 + block_rows, n)
+            self.factors[r0:r1] = A[r0:r1]
+
+        # perm[i] is the original row used as i-th pivot
+        self.perm = np.empty(n, dtype=np.int64)
+        remaining = np.ones(n, dtype=bool)
+        largest_pivot = 0.0
+        smallest_pivot = np.inf
+
+        for c0 in range(0, n, w):
+            c1 = min(c0 + w, n)
+            panel = np.array(self.factors[:, c0:c1])
+
+            # Apply the updates of every panel already factorized
+            done = np.zeros(n, dtype=bool)
+            for k0 in range(0, c0, w):
+                k1 = min(k0 + w, c0)
+                pivot_rows = self.perm[k0:k1]
+                previous_panel = np.array(self.factors[:, k0:k1])
+                done[pivot_rows] = True
+
+                upper = linalg.solve_triangular(
+                    previous_panel[pivot_rows], panel[pivot_rows],
+                    lower=True, unit_diagonal=True, check_finite=False
+                )
+                panel[pivot_rows] = upper
+
+                # Row chunks bound the fancy indexing temporaries
+                pending = np.flatnonzero(~done)
+                for start in range(0, pending.size, chunk_rows):
+                    chunk = pending[start:start + chunk_rows]
+                    panel[chunk] -= previous_panel[chunk] @ upper
+                del previous_panel
+
+            # Factorize the rows not pivoted yet (tall LU with partial pivoting)
+            # (gathered in Fortran order so that LAPACK factorizes the copy in place)
+            rows = np.flatnonzero(remaining)
+            remaining_rows = np.empty((rows.size, c1 - c0), order="F")
+            for j in range(c1 - c0):
+                remaining_rows[:, j] = panel[rows, j]
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", linalg.LinAlgWarning)
+                panel_lu, panel_piv = linalg.lu_factor(remaining_rows, overwrite_a=True, check_finite=True)
+
+            # LAPACK pivots are successive row swaps: turn them into a row order
+            for i, j in enumerate(panel_piv):
+                rows[[i, j]] = rows[[j, i]]
+
+            panel[rows] = panel_lu
+            self.perm[c0:c1] = rows[:c1 - c0]
+            remaining[rows[:c1 - c0]] = False
+
+            pivots = np.abs(np.diag(panel_lu))
+            largest_pivot = max(largest_pivot, float(pivots.max()))
+            smallest_pivot = min(smallest_pivot, float(pivots.min()))
+
+            self.factors[:, c0:c1] = panel
+            del panel, panel_lu, remaining_rows
+
+        self.factors.flush()
+        self.singular = smallest_pivot <= n * np.finfo(float).eps * largest_pivot
+
+    def solve(self, ordinate_matrix: np.ndarray) -> np.ndarray:
+        if self.singular:
+            raise ValueError("The coefficient matrix is singular.")
+
+        n, w = self.size, self.block_size
+        y = np.array(ordinate_matrix, dtype=np.float64)[self.perm]
+
+        # Forward substitution L y = P b, one panel at a time
+        for k0 in range(0, n, w):
+            k1 = min(k0 + w, n)
+            panel = np.asarray(self.factors[:, k0:k1])[self.perm]
+            y[k0:k1] = linalg.solve_triangular(panel[k0:k1], y[k0:k1], lower=True, unit_diagonal=True)
+            y[k1:] -= panel[k1:] @ y[k0:k1]
+
+        # Backward substitution U x = y, from the last panel to the first
+        for k0 in reversed(range(0, n, w)):
+            k1 = min(k0 + w, n)
+            panel = np.asarray(self.factors[:, k0:k1])[self.perm[:k1]]
+            y[k0:k1] = linalg.solve_triangular(panel[k0:k1], y[k0:k1], lower=False)
+            y[:k0] -= panel[:k0] @ y[k0:k1]
+
+        return y
+
+    def close(self) -> None:
+        # Release the memory map and delete the factors file
+        del self.factors
+        os.remove(self.storage_path)
+
+
+def solve_linear_system_out_of_core(
+    coefficient_matrix: np.ndarray,
+    ordinate_matrix: np.ndarray,
+    memory_limit: int = 256 * 1024**2
+) -> np.ndarray | None:
+    # The factors are as big as the matrix: they live in a temporary file next to the other temp data
+    storage = tempfile.NamedTemporaryFile(suffix=".lu", delete=False)
+    storage.close()
+
+    try:
+        factorization = OutOfCoreLUFactorization(coefficient_matrix, storage.name, memory_limit)
+    except Exception:
+        # The factors file may already be as big as the matrix
+        os.remove(storage.name)
+        raise
+
+    try:
+        # If the coefficient matrix is singular
+        # the linear system solution is undetermined
+        if factorization.singular:
+            return None
 
-    
+        return factorization.solve(ordinate_matrix)
+    finally:
+        factorization.close()
@@ -0,0 +1,152 @@
+import numpy as np
+from scipy import linalg, sparse
+from scipy.sparse import csgraph
+from scipy.sparse import linalg as sparse_linalg
+
+from core.stochastic_process import _validate_transition_matrix
+
+STATIONARY_METHODS = ["direct", "power"]
+
+
+def markov_classify_states(transition_matrix: list[list[float]]) -> dict[str, np.ndarray | list[np.ndarray]]:
+    # Communicating classes are the strongly connected components of the transition graph.
+    # A class that no transition leaves is closed: its states are recurrent (absorbing when
+    # the state is alone and loops on itself), every other state is transient.
+    trans_matrix = _validate_transition_matrix(transition_matrix)
+    graph = sparse.csr_matrix(trans_matrix > 0)
+
+    n_classes, labels = csgraph.connected_components(graph, directed=True, connection="strong")
+
+    # A class is open as soon as one of its transitions leads to another class
+    rows, cols = graph.nonzero()
+    leaving = labels[rows] != labels[cols]
+    is_open = np.zeros(n_classes, dtype=bool)
+    is_open[labels[rows[leaving]]] = True
+
+    types = np.where(is_open[labels], "transient", "recurrent")
+    types[np.isclose(trans_matrix.diagonal(), 1.0)] = "absorbing"
+
+    return {
+        "classes": labels,
+        "types": types,
+        "closed_classes": [np.flatnonzero(labels == label) for label in np.flatnonzero(~is_open)]
+    }
+
+
+def markov_stationary_distribution(
+    transition_matrix: list[list[float]],
+    method: str = "direct",
+    tolerance: float = 1e-12,
+    max_iterations: int = 100_000
+) -> np.ndarray:
+    if method not in STATIONARY_METHODS:
+        raise ValueError(f"Unknown method '{method}', expected one of {STATIONARY_METHODS}.")
+
+    trans_matrix = _validate_transition_matrix(transition_matrix)
+    n_states = trans_matrix.shape[0]
+
+    closed_classes = markov_classify_states(trans_matrix)["closed_classes"]
+    if len(closed_classes) > 1:
+        raise ValueError("The chain has several closed classes → the stationary distribution is not unique.")
+
+    if method == "direct" and sparse.issparse(trans_matrix):
+        # A dense normalization row would fill the sparse factorization: one recurrent
+        # state is pinned to 1 instead, its balance equation dropped, and the solution
+        # normalized afterwards
+        pinned = closed_classes[0][0]
+        kept = np.flatnonzero(np.arange(n_states) != pinned)
+        system = (trans_matrix.T - sparse.identity(n_states)).tocsr()
+
+        stationary = np.ones(n_states)
+        if kept.size:
+            stationary[kept] = sparse_linalg.spsolve(
+                system[kept][:, kept].tocsc(),
+                -system[kept][:, [pinned]].toarray().ravel()
+            )
+    elif method == "direct":
+        # pi (P - I) = 0 with sum(pi) = 1: the last balance equation (redundant) is
+        # replaced by the normalization
+        system = trans_matrix.T - np.eye(n_states)
+        system[-1] = 1.0
+        rhs = np.zeros(n_states)
+        rhs[-1] = 1.0
+
+        stationary = linalg.solve(system, rhs)
+    else:
+        # The lazy chain (P + I) / 2 has the same stationary distribution and is
+        # aperiodic, so the iteration also converges on periodic chains.
+        # pi P is computed as P^T pi (a CSR product for a sparse chain).
+        if sparse.issparse(trans_matrix):
+            lazy_transposed = ((trans_matrix + sparse.identity(n_states)) / 2).T.tocsr()
+        else:
+            lazy_transposed = ((trans_matrix + np.eye(n_states)) / 2).T
+        stationary = np.full(n_states, 1.0 / n_states)
+
+        for _ in range(max_iterations):
+            next_stationary = lazy_transposed @ stationary
+            if np.abs(next_stationary - stationary).sum() <= tolerance:
+                stationary = next_stationary
+                break
+            stationary = next_stationary
+        else:
+            raise ValueError("The power iteration did not converge.")
+
+    # Remove rounding noise
+    stationary = np.clip(stationary, 0.0, None)
+
+    return stationary / stationary.sum()
+
+
+def markov_absorption_analysis(transition_matrix: list[list[float]]) -> dict[str, np.ndarray | list[np.ndarray]]:
+    # With the transient states T and the closed classes C, the chain is P = [[Q, R], [0, *]].
+    # N = (I - Q)^-1 is the expected number of visits to each transient state, B = N R the
+    # probability of ending in each closed class, and t = N 1 the expected steps before that.
+    # I - Q is factorized once and every quantity comes from triangular solves. For a sparse
+    # chain, N (dense, transient states squared) is not formed: it is None.
+    trans_matrix = _validate_transition_matrix(transition_matrix)
+    classification = markov_classify_states(trans_matrix)
+
+    transient = np.flatnonzero(classification["types"] == "transient")
+    closed_classes = classification["closed_classes"]
+
+    if transient.size == 0:
+        return {
+            "transient_states": transient,
+            "absorbing_classes": closed_classes,
+            "fundamental_matrix": np.empty((0, 0)),
+            "absorption_probabilities": np.empty((0, len(closed_classes))),
+            "expected_steps": np.empty(0)
+        }
+
+    # Transitions from the transient states into each closed class
+    class_of_state = np.full(trans_matrix.shape[0], -1)
+    for label, states in enumerate(closed_classes):
+        class_of_state[states] = label
+
+    if sparse.issparse(trans_matrix):
+        from_transient = trans_matrix[transient]
+        Q = from_transient[:, transient]
+        into_classes = from_transient.tocoo()
+        closed = class_of_state[into_classes.col] >= 0
+        R = sparse.csr_matrix(
+            (into_classes.data[closed], (into_classes.row[closed], class_of_state[into_classes.col[closed]])),
+            shape=(transient.size, len(closed_classes))
+        ).toarray()
+
+        solve = sparse_linalg.splu((sparse.identity(transient.size) - Q).tocsc()).solve
+        fundamental_matrix = None
+    else:
+        Q = trans_matrix[np.ix_(transient, transient)]
+        R = np.column_stack([trans_matrix[np.ix_(transient, states)].sum(axis=1) for states in closed_classes])
+
+        factorization = linalg.lu_factor(np.eye(transient.size) - Q)
+        solve = lambda b: linalg.lu_solve(factorization, b)
+        fundamental_matrix = solve(np.eye(transient.size))
+
+    return {
+        "transient_states": transient,
+        "absorbing_classes": closed_classes,
+        "fundamental_matrix": fundamental_matrix,
+        "absorption_probabilities": solve(R),
+        "expected_steps": solve(np.ones(transient.size))
+    }
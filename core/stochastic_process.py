@@ -1,61 +1,454 @@
 import numpy as np
+import pandas as pd
+from scipy import sparse
+
+def _validate_transition_matrix(transition_matrix) -> np.ndarray | sparse.csr_matrix:
+    # Sparse matrices stay sparse (CSR): memory follows the number of transitions
+    if sparse.issparse(transition_matrix):
+        trans_matrix = sparse.csr_matrix(transition_matrix, dtype=np.float64)
+        trans_matrix.sum_duplicates()
+        trans_matrix.eliminate_zeros()
+        values = trans_matrix.data
+    else:
+        trans_matrix = np.asarray(transition_matrix, dtype=np.float64)
+        values = trans_matrix
+
+    if trans_matrix.ndim != 2 or trans_matrix.shape[0] != trans_matrix.shape[1]:
+        raise ValueError("The transition matrix must be square.")
+    if np.any(values < 0):
+        raise ValueError("The transition probabilities must be non negative.")
+    if not np.allclose(np.asarray(trans_matrix.sum(axis=1)).ravel(), 1.0):
+        raise ValueError("Each row of the transition matrix must sum to 1.")
+
+    return trans_matrix
+
+
+def stochastic_process_load_transition_matrix(
+    path,
+    from_col: str = "from",
+    to_col: str = "to",
+    probability_col: str = "probability"
+) -> dict[str, np.ndarray | sparse.csr_matrix]:
+    # Edge list "from,to,probability" (one row per transition) → sparse transition matrix.
+    # States are the sorted labels found in both columns; repeated transitions are summed.
+    edges = pd.read_csv(path, usecols=[from_col, to_col, probability_col])
+
+    codes, states = pd.factorize(pd.concat([edges[from_col], edges[to_col]], ignore_index=True), sort=True)
+    if np.any(codes < 0):
+        raise ValueError("Every transition must have a source and a target state.")
+
+    n_transitions = len(edges)
+    trans_matrix = sparse.csr_matrix(
+        (edges[probability_col].to_numpy(dtype=np.float64), (codes[:n_transitions], codes[n_transitions:])),
+        shape=(states.size, states.size)
+    )
+
+    return {
+        "states": np.asarray(states),
+        "transition_matrix": _validate_transition_matrix(trans_matrix)
+    }
+
+
+def _validate_distribution(distribution, n_states: int) -> np.ndarray:
+    distribution = np.asarray(distribution, dtype=np.float64)
+
+    if distribution.shape != (n_states,):
+        raise ValueError("The size of the initial distribution must match to the size of the transition matrix.")
+    if np.any(distribution < 0) or not np.isclose(distribution.sum(), 1.0):
+        raise ValueError("The initial distribution must sum to 1.")
+
+    return distribution
+
+
+def _validate_distributions(initial_distributions, n_states: int) -> np.ndarray:
+    # One distribution per row, all checked at once
+    distributions = np.asarray(initial_distributions, dtype=np.float64)
+
+    if distributions.ndim != 2 or distributions.shape[1] != n_states:
+        raise ValueError("The initial distributions must be a (k, n) matrix, n being the size of the transition matrix.")
+    if np.any(distributions < 0) or not np.allclose(distributions.sum(axis=1), 1.0):
+        raise ValueError("Each initial distribution must sum to 1.")
+
+    return distributions
+
 
 def stochastic_process_simule_markov_chain(
     # states: list[str],
     transition_matrix: list[list[float]],
     initial_distribution: list[float],
-    target_time: int
-) -> list[list[float]]:
-    # Validate dimensions
-    if len(transition_matrix) != len(initial_distribution):
-        raise ValueError("The size of the initial distribution must match to the size of the transition matrix.")
+    target_time: int,
+    tolerance: float | None = None
+) -> np.ndarray:
+    trans_matrix = _validate_transition_matrix(transition_matrix)
+    distribution = _validate_distribution(initial_distribution, trans_matrix.shape[0])
 
-    # Validate that the transition matrix
-    for row in transition_matrix:
-        if not np.isclose(sum(row), 1.0):
-            raise ValueError("Each row of the transition matrix must sum to 1.")
+    return _evolve_distributions(
+        trans_matrix, distribution[np.newaxis], target_time, np.arange(target_time + 1), tolerance
+    )[:, 0]
 
-    # Validate that the initial distribution
-    if not np.isclose(sum(initial_distribution), 1.0):
-        raise ValueError("The initial distribution must sum to 1.")
-    
-    trans_matrix = np.array(transition_matrix)
-    dist_evolutions: list[list[float]] = [initial_distribution]
+
+def stochastic_process_simule_markov_chain_batch(
+    transition_matrix: list[list[float]],
+    initial_distributions: list[list[float]],
+    target_time: int,
+    checkpoints: list[int] | None = None,
+    tolerance: float | None = None
+) -> np.ndarray:
+    # Returns the (T + 1, k, n) evolution, or only the rows of the checkpoints
+    trans_matrix = _validate_transition_matrix(transition_matrix)
+    distributions = _validate_distributions(initial_distributions, trans_matrix.shape[0])
+
+    if checkpoints is None:
+        checkpoints = np.arange(target_time + 1)
+    else:
+        checkpoints = np.asarray(checkpoints, dtype=np.int64)
+        if checkpoints.ndim != 1 or np.any(checkpoints < 0) or np.any(checkpoints > target_time):
+            raise ValueError("The checkpoints must be times between 0 and the target time.")
+
+    return _evolve_distributions(trans_matrix, distributions, target_time, checkpoints, tolerance)
+
+
+def _evolve_distributions(
+    trans_matrix: np.ndarray | sparse.csr_matrix,
+    distributions: np.ndarray,
+    target_time: int,
+    checkpoints: np.ndarray,
+    tolerance: float | None
+) -> np.ndarray:
+    # k chains evolved together: the distributions are the columns of an (n, k) matrix
+    # moved by one matrix-matrix product P^T D per step (a sparse product in CSR)
+    # Output rows of each time (several rows when a checkpoint is repeated)
+    order = np.argsort(checkpoints, kind="stable")
+    sorted_times = checkpoints[order]
+
+    # One (k, n) block per checkpoint, allocated once
+    dist_evolutions = np.empty((checkpoints.size, *distributions.shape))
+
+    transposed = trans_matrix.T.tocsr() if sparse.issparse(trans_matrix) else trans_matrix.T
+    current = np.ascontiguousarray(distributions.T)
+    position = 0
 
     # Simulation
-    for i in range(target_time):
-        dist = np.matmul(dist_evolutions[i], trans_matrix)
-        dist_evolutions.append(dist.tolist())
+    for t in range(target_time + 1):
+        if t:
+            next_current = transposed @ current
+
+            # Every chain stationary within the tolerance (L1 distance): the remaining checkpoints are the same
+            if tolerance is not None and np.abs(next_current - current).sum(axis=0).max() <= tolerance:
+                dist_evolutions[order[position:]] = next_current.T
+                break
+            current = next_current
+
+        while position < sorted_times.size and sorted_times[position] == t:
+            dist_evolutions[order[position]] = current.T
+            position += 1
 
     return dist_evolutions
 
 
-def stochastic_process_simule_random_walk_with_markov_chain():
-    pass
+# Sparse chains up to this number of states are converted to dense matrices to be squared
+MAX_DENSE_POWER_STATES = 2048
 
+# Step budget of a large sparse chain (moved one product at a time) before giving up
+MAX_SPARSE_STEPS = 100_000
 
-def stochastic_process_simule_random_walk(
+
+def stochastic_process_markov_chain_at_times(
+    transition_matrix: list[list[float]],
+    initial_distribution: list[float],
+    times: list[int],
+    tolerance: float | None = None
+) -> dict[str, np.ndarray | int | None]:
+    # Distribution at the requested times only: the chain jumps from one time to the next
+    # with the binary decomposition of the gap, using the cached powers P^(2^k), so that
+    # t = 10^9 costs about 30 matrix squarings instead of 10^9 products
+    trans_matrix = _validate_transition_matrix(transition_matrix)
+    initial = _validate_distribution(initial_distribution, trans_matrix.shape[0])
+
+    times = np.asarray(times, dtype=np.int64)
+    if times.ndim != 1 or np.any(times < 0):
+        raise ValueError("The times must be a list of non negative integers.")
+
+    if sparse.issparse(trans_matrix):
+        # A small sparse chain is squared densely: it fits in memory and far horizons stay cheap
+        if trans_matrix.shape[0] > MAX_DENSE_POWER_STATES:
+            return _markov_chain_at_times_sparse(trans_matrix, initial, times, tolerance)
+        trans_matrix = trans_matrix.toarray()
+
+    powers = [trans_matrix]
+    limit = None
+    converged_at = None
+
+    def power(k: int) -> np.ndarray:
+        nonlocal limit, converged_at
+
+        while len(powers) <= k:
+            # P^(2^k) no longer changes: every later power is the limit matrix (the low
+            # bits of a gap still use the exact powers, so periodic chains keep their phase)
+            if limit is not None:
+                return limit
+
+            # Squaring doubles any row sum error: rows are brought back to 1 each time
+            square = powers[-1] @ powers[-1]
+            square /= square.sum(axis=1, keepdims=True)
+            powers.append(square)
+
+            if tolerance is not None and np.abs(powers[-1] - powers[-2]).max() <= tolerance:
+                limit = powers[-1]
+                converged_at = 2 ** (len(powers) - 2)
+
+        return powers[k]
+
+    distributions = np.empty((times.size, trans_matrix.shape[0]))
+    distribution = initial
+    current_time = 0
+
+    for index in np.argsort(times, kind="stable"):
+        target_time = int(times[index])
+
+        gap = target_time - current_time
+        k = 0
+        while gap:
+            if gap & 1:
+                distribution = distribution @ power(k)
+            gap >>= 1
+            k += 1
+
+        current_time = target_time
+        distributions[index] = distribution
+
+    return {
+        "times": times,
+        "distributions": distributions,
+        "converged_at": converged_at
+    }
+
+
+def _markov_chain_at_times_sparse(
+    trans_matrix: sparse.csr_matrix,
+    initial: np.ndarray,
+    times: np.ndarray,
+    tolerance: float | None
+) -> dict[str, np.ndarray | int | None]:
+    # Powers of a sparse matrix fill in: the distribution is moved one sparse product at a
+    # time instead, and only kept at the requested times (or until it stops changing),
+    # within a budget of MAX_SPARSE_STEPS products
+    transposed = trans_matrix.T.tocsr()
+    distributions = np.empty((times.size, initial.size))
+    distribution = initial
+    current_time = 0
+    converged_at = None
+
+    for index in np.argsort(times, kind="stable"):
+        target_time = int(times[index])
+
+        while converged_at is None and current_time < min(target_time, MAX_SPARSE_STEPS):
+            next_distribution = transposed @ distribution
+            current_time += 1
+
+            if tolerance is not None and np.abs(next_distribution - distribution).sum() <= tolerance:
+                converged_at = current_time
+            distribution = next_distribution
+
+        if converged_at is None and current_time < target_time:
+            raise ValueError(f"The sparse chain is not stationary after {MAX_SPARSE_STEPS} steps: t = {target_time} is out of reach.")
+
+        distributions[index] = distribution
+
+    return {
+        "times": times,
+        "distributions": distributions,
+        "converged_at": converged_at
+    }
+
+
+# Above this number of states, hitting times are only tracked for the absorbing states by default
+MAX_DEFAULT_TARGETS = 256
+
+# Memory of the default hitting times (one int32 per target and per path)
+HITTING_TIMES_MEMORY_BYTES = 64 * 1024**2
+
+
+def stochastic_process_simule_random_walk_with_markov_chain(
+    transition_matrix: list[list[float]],
+    initial_distribution: list[float],
+    step: int,
+    n_paths: int = 1000,
+    seed: int | np.random.Generator | None = None,
+    store_paths: bool = False,
+    targets: list[int] | None = None,
+    occupancy_times: list[int] | None = None
+) -> dict[str, np.ndarray | float | None]:
+    # Monte Carlo simulation of n_paths independent trajectories of the chain, all moved
+    # in lockstep: one uniform draw per path and per step, looked up in the cumulative
+    # rows of the matrix laid end to end (row i shifted by +i), so a single searchsorted
+    # moves every path at once. Only the non-zero transitions (CSR) are stored, so large
+    # sparse chains cost memory in the number of transitions. The occupancy (n_states
+    # values) is kept at every time for a small chain, only at the last one for a large
+    # chain, unless occupancy_times are given.
+    trans_matrix = _validate_transition_matrix(transition_matrix)
+    n_states = trans_matrix.shape[0]
+    initial_distribution = _validate_distribution(initial_distribution, n_states)
+
+    if step <= 0:
+        raise ValueError("The number of steps must be a positive integer.")
+    if n_paths <= 0:
+        raise ValueError("The number of paths must be a positive integer.")
+
+    # Hitting times are tracked for the target states only. By default: every state of a
+    # small chain, else the absorbing states, as long as they fit in HITTING_TIMES_MEMORY_BYTES
+    # for this number of paths (none otherwise)
+    absorbing = np.isclose(trans_matrix.diagonal(), 1.0)
+    if targets is None:
+        max_targets = HITTING_TIMES_MEMORY_BYTES // (4 * n_paths)
+        if n_states <= min(MAX_DEFAULT_TARGETS, max_targets):
+            targets = np.arange(n_states)
+        elif np.count_nonzero(absorbing) <= max_targets:
+            targets = np.flatnonzero(absorbing)
+        else:
+            targets = np.empty(0, dtype=np.int64)
+    targets = np.asarray(targets, dtype=np.int64)
+    target_index = np.full(n_states, -1, dtype=np.int64)
+    target_index[targets] = np.arange(targets.size)
+
+    if occupancy_times is None:
+        occupancy_times = np.arange(step + 1) if n_states <= MAX_DEFAULT_TARGETS else np.array([step])
+    occupancy_times = np.unique(np.asarray(occupancy_times, dtype=np.int64))
+    if occupancy_times.size == 0 or occupancy_times[0] < 0 or occupancy_times[-1] > step:
+        raise ValueError("The occupancy times must be between 0 and the number of steps.")
+    occupancy_row = np.full(step + 1, -1, dtype=np.int64)
+    occupancy_row[occupancy_times] = np.arange(occupancy_times.size)
+
+    transitions = sparse.csr_matrix(trans_matrix)
+    transitions.eliminate_zeros()
+    row_lengths = np.diff(transitions.indptr)
+    row_of_entry = np.repeat(np.arange(n_states), row_lengths)
+
+    # Cumulative probabilities within each row, the last one exactly 1, then shifted by the row
+    cumulative = np.cumsum(transitions.data)
+    cumulative -= np.repeat(np.r_[0.0, cumulative[transitions.indptr[1:-1] - 1]], row_lengths)
+    cumulative[transitions.indptr[1:] - 1] = 1.0
+    cumulative += row_of_entry
+    last_entry = transitions.indptr[1:] - 1
+    dtype = _state_codes_dtype(n_states)
+    path_index = np.arange(n_paths)
+
+    rng = np.random.default_rng(seed)
+    current = rng.choice(n_states, size=n_paths, p=initial_distribution / initial_distribution.sum())
+
+    paths = np.empty((step + 1, n_paths), dtype=dtype) if store_paths else None
+    occupancy = np.empty((occupancy_times.size, n_states))
+
+    # "Not reached yet" is the largest time, so that a first visit is a minimum
+    not_reached = np.iinfo(np.int32).max
+    hitting_times = np.full(targets.size * n_paths, not_reached, dtype=np.int32)
+    absorption_times = np.full(n_paths, not_reached, dtype=np.int32)
+    all_targets = targets.size == n_states and np.array_equal(np.sort(targets), np.arange(n_states))
+
+    def record(t: int) -> None:
+        if store_paths:
+            paths[t] = current
+        if occupancy_row[t] >= 0:
+            occupancy[occupancy_row[t]] = np.bincount(current, minlength=n_states) / n_paths
+
+        # First visit of each path to its current state (if it is a target),
+        # in the flat (target, path) array
+        if all_targets:
+            flat = target_index[current] * n_paths + path_index
+        else:
+            rows = target_index[current]
+            tracked = rows >= 0
+            flat = rows[tracked] * n_paths + path_index[tracked]
+        hitting_times[flat] = np.minimum(hitting_times[flat], t)
+
+        np.minimum(absorption_times, np.where(absorbing[current], t, not_reached), out=absorption_times)
+
+    record(0)
+    for t in range(1, step + 1):
+        # Every path absorbed: nothing moves anymore
+        if absorption_times.max() < not_reached:
+            if store_paths:
+                paths[t:] = current
+            occupancy[occupancy_row[t:][occupancy_row[t:] >= 0]] = np.bincount(current, minlength=n_states) / n_paths
+            break
+
+        draws = current + rng.random(n_paths)
+        entries = np.searchsorted(cumulative, draws, side="right")
+        # Rounding of "row + draw" must not leave the row
+        np.minimum(entries, last_entry[current], out=entries)
+        current = transitions.indices[entries].astype(np.int64)
+        record(t)
+
+    # Statistics over the paths that reached each target / were absorbed
+    hitting_times = hitting_times.reshape(targets.size, n_paths)
+    hit = hitting_times < not_reached
+    with np.errstate(invalid="ignore"):
+        mean_hitting_time = np.where(hit, hitting_times, 0).sum(axis=1, dtype=np.float64) / hit.sum(axis=1)
+    absorbed = absorption_times < not_reached
+    final_counts = np.bincount(current, minlength=n_states)
+
+    return {
+        "paths": paths,
+        "occupancy": occupancy,
+        "occupancy_times": occupancy_times,
+        "targets": targets,
+        "hitting_probability": hit.mean(axis=1),
+        "mean_hitting_time": mean_hitting_time,
+        "absorbing_states": np.flatnonzero(absorbing),
+        "absorption_probability": final_counts[absorbing] / n_paths,
+        "mean_absorption_time": float(absorption_times[absorbed].mean()) if absorbed.any() else None
+    }
+
+
+def _state_codes_dtype(n_states: int) -> np.dtype:
+    # Smallest unsigned integer type able to hold every state code
+    if n_states <= np.iinfo(np.uint8).max + 1:
+        return np.dtype(np.uint8)
+    if n_states <= np.iinfo(np.uint16).max + 1:
+        return np.dtype(np.uint16)
+
+    return np.dtype(np.uint32)
+
+
+def stochastic_process_sample_random_walk(
     states: list[str],
     probabilities: list[float],
-    step: int
-) -> list[str]:
+    step: int,
+    seed: int | np.random.Generator | None = None
+) -> dict[str, np.ndarray]:
     if len(states) != len(probabilities):
         raise ValueError("The number of states must match the size of the probabilities.")
 
     # Validate that the probabilities distribution
-    if not np.isclose(sum(probabilities), 1.0):
+    probabilities = np.asarray(probabilities, dtype=np.float64)
+    if np.any(probabilities < 0) or not np.isclose(probabilities.sum(), 1.0):
         raise ValueError("The probabilities distribution must sum to 1.")
     
     # Validate that step
     if step <= 0:
         raise ValueError("The number of steps must be a positive integer.")
-    
-    # Simulation
-    path_evolution: list[str] = []
-    for _ in range(step):
-        path_evolution.append(str(np.random.choice(states, p=probabilities)))
 
-    return path_evolution
+    # Every step drawn at once; the walk is kept as codes into the states table
+    rng = np.random.default_rng(seed)
+    codes = rng.choice(len(states), size=step, p=probabilities / probabilities.sum())
+    codes = codes.astype(_state_codes_dtype(len(states)))
+
+    return {
+        "states": np.asarray(states),
+        "codes": codes,
+        "counts": np.bincount(codes, minlength=len(states))
+    }
+
+
+def stochastic_process_simule_random_walk(
+    states: list[str],
+    probabilities: list[float],
+    step: int,
+    seed: int | np.random.Generator | None = None
+) -> list[str]:
+    walk = stochastic_process_sample_random_walk(states, probabilities, step, seed)
+
+    return walk["states"][walk["codes"]].tolist()
 
 
 # transition_matrix = [
@@ -1,14 +1,161 @@
 import streamlit as st
 import pandas as pd
+import matplotlib.pyplot as plt
 import tempfile
 import os
-from core.linear_programmation import lp_solve, lp_maximize_from_csv, lp_minimize_from_csv
+from core.linear_programmation import (
+    lp_solve_detailed,
+    lp_solve_milp,
+    lp_extract_data_from_csv,
+    lp_extract_data_from_triplets,
+    lp_extract_data_from_mps,
+    lp_extract_scenarios_from_csv,
+    lp_solve_scenarios
+)
 
 input_modes = [
     "📁 Import CSV",
-    "✍️ Saisie manuelle"
+    "✍️ Saisie manuelle",
+    "🧮 Modèle creux (triplets / MPS)"
 ]
 
+# Above this number of variables, the solution is displayed as a table only
+MAX_METRICS_VARIABLES = 20
+
+variable_types = {
+    "Continues": "continuous",
+    "Entières": "integer",
+    "Binaires (0/1)": "binary"
+}
+
+def display_scenarios_graph(scenarios_table: pd.DataFrame) -> None:
+    variables_columns = [col for col in scenarios_table.columns if col not in ("scenario", "status", "objective")]
+
+    fig, (ax_objective, ax_variables) = plt.subplots(2, 1, figsize=(10, 7), sharex=True)
+
+    # Objective value per scenario
+    ax_objective.plot(
+        scenarios_table["scenario"],
+        scenarios_table["objective"],
+        marker='o',
+        color='green',
+        linewidth=2
+    )
+    ax_objective.set_ylabel("Objectif", fontsize=12, fontweight="bold")
+    ax_objective.set_title("Résultats par scénario", fontsize=14, fontweight="bold")
+    ax_objective.grid(True, alpha=0.3)
+
+    # Decision variables per scenario
+    for col in variables_columns:
+        ax_variables.plot(
+            scenarios_table["scenario"],
+            scenarios_table[col],
+            marker='o',
+            label=col,
+            linewidth=2
+        )
+    ax_variables.set_xlabel("Scénario", fontsize=12, fontweight="bold")
+    ax_variables.set_ylabel("Variables de décision", fontsize=12, fontweight="bold")
+    ax_variables.legend(loc="best")
+    ax_variables.grid(True, alpha=0.3)
+
+    st.pyplot(fig)
+
+def display_presolve_report(report: dict) -> None:
+    rows_before, rows_after = report["rows"]
+    columns_before, columns_after = report["columns"]
+
+    with st.expander(f"🧹 Présolve : {rows_before} → {rows_after} contraintes, {columns_before} → {columns_after} variables"):
+        st.markdown(
+            f"- Contraintes vides supprimées : {len(report['empty_rows'])}\n"
+            f"- Contraintes à une variable converties en bornes : {len(report['singleton_rows'])}\n"
+            f"- Contraintes dupliquées supprimées : {len(report['duplicate_rows'])}\n"
+            f"- Variables absentes des contraintes fixées : {len(report['empty_columns'])}\n"
+            f"- Variables dominées fixées : {len(report['dominated_columns'])}\n"
+            f"- Variables fixées par leurs bornes : {len(report['fixed_columns'])}\n"
+            f"- Bornes resserrées : {report['tightened_bounds']}"
+        )
+
+def display_lp_result(result: dict, problem_type: str) -> None:
+    if result["cached"]:
+        st.caption("⚡ Solution retrouvée dans le cache (modèle déjà résolu)")
+
+    if result["presolve"] is not None:
+        display_presolve_report(result["presolve"])
+
+    if result["status"] != "Optimal":
+        st.error(f"❌ Statut du solveur : {result['status']}")
+        return
+
+    # Display result
+    st.success(f"✅ Problème de {problem_type.lower()} résolu !")
+    st.metric(label="Valeur de l'objectif", value=f"{result['objective']:.4f}")
+
+    if len(result["variables"]) <= MAX_METRICS_VARIABLES:
+        for var, val in result["variables"].items():
+            st.metric(label=var, value=f"{val:.4f}")
+
+    # Sensitivity analysis, read from the same solve
+    st.markdown("**Analyse de sensibilité des contraintes**")
+    st.dataframe(
+        pd.DataFrame({
+            "Prix dual": result["duals"],
+            "Écart": result["slacks"],
+            "Limite min": {name: lower for name, (lower, _) in result["rhs_ranging"].items()},
+            "Limite max": {name: upper for name, (_, upper) in result["rhs_ranging"].items()}
+        }),
+        width="stretch"
+    )
+
+    st.markdown("**Coûts réduits des variables**")
+    st.dataframe(
+        pd.DataFrame({
+            "Valeur": result["variables"],
+            "Coût réduit": result["reduced_costs"]
+        }),
+        width="stretch"
+    )
+
+def display_milp_trajectory(trajectory: pd.DataFrame) -> None:
+    fig, ax = plt.subplots(figsize=(10, 4))
+
+    ax.step(trajectory["time"], trajectory["incumbent"], where="post", marker='o', color='green', linewidth=2, label="Meilleure solution")
+    ax.step(trajectory["time"], trajectory["bound"], where="post", marker='o', color='red', linewidth=2, label="Borne")
+    ax.set_xlabel("Temps (s)", fontsize=12, fontweight="bold")
+    ax.set_ylabel("Objectif", fontsize=12, fontweight="bold")
+    ax.set_title("Progression du branch and bound", fontsize=14, fontweight="bold")
+    ax.legend(loc="best")
+    ax.grid(True, alpha=0.3)
+
+    st.pyplot(fig)
+
+def display_milp_result(result: dict, problem_type: str) -> None:
+    if result["objective"] is None:
+        st.error(f"❌ Statut du solveur : {result['status']} ({result['solution_status']})")
+        return
+
+    # Display result
+    if result["solution_status"] == "Optimal Solution Found":
+        st.success(f"✅ Problème de {problem_type.lower()} en nombres entiers résolu !")
+    else:
+        st.warning("⚠️ Limite atteinte : meilleure solution trouvée, optimalité non prouvée")
+
+    col_objective, col_bound, col_gap = st.columns(3)
+    col_objective.metric(label="Valeur de l'objectif", value=f"{result['objective']:.4f}")
+    col_bound.metric(label="Borne", value="-" if result["best_bound"] is None else f"{result['best_bound']:.4f}")
+    col_gap.metric(label="Écart relatif", value="-" if result["gap"] is None else f"{100 * result['gap']:.2f} %")
+
+    if len(result["variables"]) <= MAX_METRICS_VARIABLES:
+        for var, val in result["variables"].items():
+            st.metric(label=var, value=f"{val:.4f}")
+    else:
+        st.dataframe(pd.Series(result["variables"], name="Valeur"), width="stretch")
+
+    st.caption(f"ℹ️ Solveur {result['backend'].upper()}, {result['threads']} thread(s)")
+
+    if len(result["trajectory"]) > 1:
+        display_milp_trajectory(result["trajectory"])
+
 def show():
     # === header section ====
     st.header("📊 Programmation Linéaire")
@@ -20,6 +167,52 @@ def show():
         ["Maximisation", "Minimisation"],
         horizontal=True
     )
+
+    # Presolve (the sensitivity ranges are only available on the full model)
+    presolve = st.checkbox(
+        "Présolve (réduction du modèle avant résolution)",
+        value=False,
+        key="lp_presolve"
+    )
+
+    # Integer variables and solver limits
+    with st.expander("⚙️ Variables entières et options du solveur"):
+        variable_type = st.radio(
+            "Type des variables de décision :",
+            list(variable_types),
+            horizontal=True,
+            key="lp_variable_type"
+        )
+        threads = st.number_input("Nombre de threads", min_value=1, value=os.cpu_count() or 1, step=1, key="lp_threads")
+        time_limit = st.number_input("Limite de temps (s, 0 = aucune)", min_value=0.0, value=0.0, step=1.0, key="lp_time_limit")
+        gap_rel = st.number_input("Écart relatif toléré (%)", min_value=0.0, value=0.0, step=0.1, key="lp_gap_rel")
+
+    def solve_and_display(data: dict, constraintes_names: list[str] | None = None) -> None:
+        # Continuous models keep the sensitivity analysis; integer ones go through the branch and bound
+        if variable_types[variable_type] == "continuous":
+            result = lp_solve_detailed(
+                decision_vars=data["decision_vars"],
+                decision_vars_coef=data["decision_vars_coef"],
+                constraintes_coef=data["constraintes_coef"],
+                constraintes_inequality=data["constraintes_inequality"],
+                maximize=(problem_type == "Maximisation"),
+                constraintes_names=constraintes_names,
+                presolve=presolve
+            )
+            display_lp_result(result, problem_type)
+        else:
+            result = lp_solve_milp(
+                decision_vars=data["decision_vars"],
+                decision_vars_coef=data["decision_vars_coef"],
+                constraintes_coef=data["constraintes_coef"],
+                constraintes_inequality=data["constraintes_inequality"],
+                maximize=(problem_type == "Maximisation"),
+                variable_types=[variable_types[variable_type]] * len(data["decision_vars"]),
+                threads=int(threads),
+                time_limit=time_limit or None,
+                gap_rel=gap_rel / 100 if gap_rel else None
+            )
+            display_milp_result(result, problem_type)
     
     # Disposition en 2 colonnes
     col1, col2 = st.columns([1, 1])
@@ -50,6 +243,14 @@ def show():
 
                 col_decision = st.selectbox("Colonne des variables de décision", data_frame.columns, index=0)
                 col_objective = st.selectbox("Colonne objectif", data_frame.columns, index=len(data_frame.columns)-1)
+
+            # Optional scenarios (one row per scenario, resources and/or products columns)
+            scenarios_file = st.file_uploader(
+                "Fichier de scénarios (optionnel)",
+                type=['csv'],
+                help="Une ligne par scénario : colonnes des ressources (limites) et/ou des produits (objectif)",
+                key="lp_scenarios"
+            )
             
             # Resolve button
             solve_btn = st.button("🔍 Résoudre", type="primary", width="stretch")
@@ -58,6 +259,17 @@ def show():
                 st.markdown("**Aperçu des données :**")
                 st.dataframe(data_frame, width="stretch")
         
+        elif input_mode == input_modes[2]: # Sparse model input mode
+            model_file = st.file_uploader(
+                "Choisissez un fichier de modèle",
+                type=['csv', 'mps'],
+                help="CSV : constraint,variable,coefficient (ligne « objective », colonne « rhs ») ou fichier MPS libre",
+                key="lp_sparse_model"
+            )
+
+            # Resolve button
+            solve_btn = st.button("🔍 Résoudre", type="primary", width="stretch")
+
         else:  # Manuel input
             st.markdown("**Fonction objectif (coefficients)**")
             st.caption("Coefficients séparés par des virgules")
@@ -102,26 +314,71 @@ def show():
                         tmp_file.write(uploaded_file.getvalue())
                         tmp_path = tmp_file.name
                     
-                    # Resolve
-                    if problem_type == "Maximisation":
-                        result = lp_maximize_from_csv(tmp_path, col_objective, col_decision)
+                    if scenarios_file is not None:
+                        # Resolve every scenario of the same model
+                        data = lp_extract_data_from_csv(tmp_path, col_objective, col_decision)
+                        scenarios = lp_extract_scenarios_from_csv(
+                            scenarios_file,
+                            ressources_headers=data["ressources_headers"],
+                            decision_vars=data["decision_vars"]
+                        )
+                        scenarios_table = lp_solve_scenarios(
+                            decision_vars=data["decision_vars"],
+                            decision_vars_coef=data["decision_vars_coef"],
+                            constraintes_coef=data["constraintes_coef"],
+                            constraintes_inequality=data["constraintes_inequality"],
+                            maximize=(problem_type == "Maximisation"),
+                            rhs_scenarios=scenarios["rhs_scenarios"],
+                            objective_scenarios=scenarios["objective_scenarios"]
+                        )
+
+                        # Clear temporary file
+                        os.unlink(tmp_path)
+
+                        # Display results
+                        st.success(f"✅ {len(scenarios_table)} scénarios de {problem_type.lower()} résolus !")
+                        display_scenarios_graph(scenarios_table)
+                        st.dataframe(scenarios_table, width="stretch")
+
                     else:
-                        result = lp_minimize_from_csv(tmp_path, col_objective, col_decision)
-                    
-                    # Clear temporary file
-                    os.unlink(tmp_path)
-                    
-                    # Display result
-                    st.success(f"✅ Problème de {problem_type.lower()} résolu !")
-                    
-                    for var, val in result.items():
-                        st.metric(label=var, value=f"{val:.4f}")
+                        # Resolve
+                        data = lp_extract_data_from_csv(tmp_path, col_objective, col_decision)
+
+                        # Clear temporary file
+                        os.unlink(tmp_path)
+
+                        solve_and_display(data, data["ressources_headers"])
                     
                 except Exception as e:
                     st.error(f"❌ Erreur : {str(e)}")
             else:
                 st.warning("⚠️ Veuillez charger un fichier CSV")
         
+        elif input_mode == input_modes[2] and solve_btn:
+            if model_file is not None:
+                try:
+                    # Save temporary model file
+                    suffix = os.path.splitext(model_file.name)[1]
+                    with tempfile.NamedTemporaryFile(mode='wb', delete=False, suffix=suffix) as tmp_file:
+                        tmp_file.write(model_file.getvalue())
+                        tmp_path = tmp_file.name
+
+                    if suffix == ".mps":
+                        data = lp_extract_data_from_mps(tmp_path)
+                    else:
+                        data = lp_extract_data_from_triplets(tmp_path)
+
+                    # Clear temporary file
+                    os.unlink(tmp_path)
+
+                    # Resolve
+                    solve_and_display(data, data["ressources_headers"])
+
+                except Exception as e:
+                    st.error(f"❌ Erreur : {str(e)}")
+            else:
+                st.warning("⚠️ Veuillez charger un fichier de modèle")
+
         elif input_mode == input_modes[1] and solve_btn:
             try:
                 # Parse data
@@ -136,19 +393,12 @@ def show():
                 decision_vars = [f"x{i+1}" for i in range(len(obj_coef))]
                 
                 # Resolve
-                result = lp_solve(
-                    decision_vars=decision_vars,
-                    decision_vars_coef=obj_coef,
-                    constraintes_coef=constr_coef,
-                    constraintes_inequality=avalibles_resources,
-                    maximize=(problem_type == "Maximisation")
-                )
-                
-                # Display result
-                st.success(f"✅ Problème de {problem_type.lower()} résolu !")
-                
-                for var, val in result.items():
-                    st.metric(label=var, value=f"{val:.4f}")
+                solve_and_display({
+                    "decision_vars": decision_vars,
+                    "decision_vars_coef": obj_coef,
+                    "constraintes_coef": constr_coef,
+                    "constraintes_inequality": avalibles_resources
+                })
                 
             except Exception as e:
                 st.error(f"❌ Erreur : {str(e)}")
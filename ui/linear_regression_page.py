@@ -3,24 +3,62 @@ import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 
-from core.linear_regression import linear_regression_compute
+from core.linear_regression import (
+    linear_regression_compute,
+    linear_regression_compute_multiple,
+    linear_regression_compute_grouped,
+    linear_regression_bootstrap,
+    linear_regression_permutation_test,
+    RegressionStatistics
+)
+
+NO_GROUP = "(aucun)"
+
+# Above this number of points, the cloud is drawn as a 2-D density instead of one marker per point
+MAX_SCATTER_POINTS = 10_000
+DENSITY_BINS = 200
+
+def plot_points(ax, X_data, Y_data, max_points: int = MAX_SCATTER_POINTS) -> None:
+    X = np.asarray(X_data, dtype=float)
+    Y = np.asarray(Y_data, dtype=float)
+
+    # Exact rendering for small data
+    if X.size <= max_points:
+        ax.scatter(X, Y, color='blue', label='Données', s=50, alpha=0.6)
+        return
+
+    # Large data: count the points of each cell of a 2-D grid and draw the counts
+    finite = np.isfinite(X) & np.isfinite(Y)
+    counts, x_edges, y_edges = np.histogram2d(X[finite], Y[finite], bins=DENSITY_BINS)
+    mesh = ax.pcolormesh(
+        x_edges,
+        y_edges,
+        np.ma.masked_equal(counts.T, 0),
+        cmap='Blues',
+        norm='log'
+    )
+    ax.figure.colorbar(mesh, ax=ax, label='Points par case')
+    # The legend does not handle meshes: an empty marker stands for the density
+    ax.scatter([], [], marker='s', color=plt.cm.Blues(0.7), label='Données (densité)')
+
+    def thousands(number: int) -> str:
+        return f"{number:,}".replace(",", " ")
+
+    st.caption(
+        f"ℹ️ {thousands(int(finite.sum()))} points agrégés en {thousands(int(np.count_nonzero(counts)))} cases "
+        f"(grille {DENSITY_BINS}×{DENSITY_BINS}, au-delà de {thousands(max_points)} points)"
+    )
 
 def display_data_points_cloud_graphic(
     X_data: list[float],
     X_label: str,
     Y_data: list[float],
-    Y_lable: str
+    Y_lable: str,
+    max_points: int = MAX_SCATTER_POINTS
 ) -> None:
     fig, ax = plt.subplots(figsize=(8, 5))
 
-    ax.scatter(
-        X_data, 
-        Y_data, 
-        color='blue', 
-        label='Données', 
-        s=50, 
-        alpha=0.6
-    )
+    plot_points(ax, X_data, Y_data, max_points)
     
     ax.set_xlabel(f"{X_label}(X)", fontsize=12)
     ax.set_ylabel(f"{Y_lable} (Y)", fontsize=12)
@@ -38,23 +76,17 @@ def display_regressionline(
         X_data: list[float],
         X_label: str,
         Y_data: list[float],
-        Y_lable: str
+        Y_lable: str,
+        max_points: int = MAX_SCATTER_POINTS
 ) -> None:
     st.markdown("**Graphique**")
     fig, ax = plt.subplots(figsize=(8, 5))
     
     # Points cloud
-    ax.scatter(
-        X_data, 
-        Y_data, 
-        color='blue', 
-        label='Données', 
-        s=50, 
-        alpha=0.6
-    )   
+    plot_points(ax, X_data, Y_data, max_points)
     
     # Regression line
-    x_line = np.linspace(min(X_data), max(X_data), 100)
+    x_line = np.linspace(np.min(X_data), np.max(X_data), 100)
     y_line = a * x_line + b
     ax.plot(
         x_line, 
@@ -74,9 +106,96 @@ def display_regressionline(
     
     st.pyplot(fig)
 
+def display_multiple_regression_result(
+    result: dict,
+    explicative_cols: list[str],
+    target_col: str
+) -> None:
+    st.success("✅ Régression multiple calculée !")
+
+    col_r2, col_intercept = st.columns(2)
+    col_r2.metric("R²", f"{result['r2']:.3f}")
+    col_intercept.metric("Constante", f"{result['intercept']:.3f}")
+
+    # One coefficient per explanatory column
+    st.markdown(f"**Coefficients ({target_col})**")
+    st.dataframe(
+        pd.DataFrame({"Coefficient": result["coefficients"]}, index=explicative_cols),
+        width="stretch"
+    )
+
+def display_confidence_intervals(
+    result: dict,
+    bootstrap: dict,
+    permutation_test: dict,
+    confidence: float
+) -> None:
+    st.markdown(f"**Intervalles de confiance à {confidence:.0%} (bootstrap, {bootstrap['n_resamples']} rééchantillonnages)**")
+    st.dataframe(
+        pd.DataFrame(
+            {
+                "Estimation": [result[name] for name in ("a", "b", "correlation")],
+                "Borne basse": [bootstrap[name][0] for name in ("a", "b", "correlation")],
+                "Borne haute": [bootstrap[name][1] for name in ("a", "b", "correlation")]
+            },
+            index=["a", "b", "Corrélation"]
+        ),
+        width="stretch"
+    )
+
+    st.metric(
+        f"p-valeur du test de permutation ({permutation_test['n_permutations']} permutations)",
+        f"{permutation_test['p_value']:.4f}"
+    )
+
+def show_live_regression(
+    explicative_vars: list[float] | None,
+    target_vars: list[float] | None
+) -> None:
+    # The accumulator is kept serialized in the session, so it survives reruns
+    # and every added or removed point costs O(1)
+    st.subheader("📡 Régression en direct")
+
+    if "reg_live_statistics" not in st.session_state:
+        st.session_state["reg_live_statistics"] = RegressionStatistics().to_dict()
+    statistics = RegressionStatistics.from_dict(st.session_state["reg_live_statistics"])
+
+    col_x, col_y = st.columns(2)
+    x = col_x.number_input("X", value=0.0, key="reg_live_x")
+    y = col_y.number_input("Y", value=0.0, key="reg_live_y")
+
+    col_add, col_remove, col_load, col_reset = st.columns(4)
+    try:
+        if col_add.button("➕ Ajouter", width="stretch", key="reg_live_add"):
+            statistics.add(x, y)
+        if col_remove.button("➖ Retirer", width="stretch", key="reg_live_remove"):
+            statistics.remove(x, y)
+        if col_load.button("📁 Ajouter le CSV", width="stretch", key="reg_live_load", disabled=explicative_vars is None):
+            statistics.update(explicative_vars, target_vars)
+        if col_reset.button("🔄 Réinitialiser", width="stretch", key="reg_live_reset"):
+            statistics = RegressionStatistics()
+    except Exception as e:
+        st.error(f"❌ Erreur : {str(e)}")
+
+    st.session_state["reg_live_statistics"] = statistics.to_dict()
+
+    if statistics.n < 2 or statistics.m2_X == 0:
+        st.info(f"ℹ️ {statistics.n} point(s) : ajoutez des points avec des X différents")
+        return
+
+    result = statistics.result()
+    col_n, col_equation, col_correlation = st.columns(3)
+    col_n.metric("Points", result["n"])
+    col_equation.metric("Équation", f"y = {result['a']:.3f}x + {result['b']:.3f}")
+    col_correlation.metric("Corrélation", f"{result['correlation']:.3f}")
+
 def show():
     st.header("📈 Régression Linéaire")
     st.markdown("Analyse de régression et prédiction")
+
+    # Simple regression data (one explanatory column), reused by the live regression
+    explicative_vars = None
+    target_vars = None
     
     col1, col2 = st.columns([1, 1])
     
@@ -91,6 +210,21 @@ def show():
             key="reg_csv"
         )
 
+        # Resampling (simple regression only)
+        with st.expander("🎲 Intervalles de confiance (bootstrap)"):
+            resampling = st.checkbox("Calculer les intervalles et le test de permutation", value=False, key="reg_bootstrap")
+            n_resamples = st.number_input("Nombre de rééchantillonnages", min_value=100, value=2000, step=100, key="reg_resamples")
+            confidence = st.slider("Niveau de confiance", min_value=0.80, max_value=0.99, value=0.95, step=0.01, key="reg_confidence")
+            seed = st.number_input("Graine aléatoire", min_value=0, value=0, step=1, key="reg_seed")
+
+        max_points = st.number_input(
+            "Nombre de points au-delà duquel le nuage est agrégé",
+            min_value=100,
+            value=MAX_SCATTER_POINTS,
+            step=1000,
+            key="reg_max_points"
+        )
+
         compute_btn = st.button("📊 Calculer", type="primary", width="stretch")
         
         if uploaded_file is not None:
@@ -98,32 +232,41 @@ def show():
             data_frame = pd.read_csv(uploaded_file)
 
             # Select explicative and tager col
-            explicative_col = st.selectbox(
-                "Colonne des variables explicative", 
+            explicative_cols = st.multiselect(
+                "Colonnes des variables explicatives", 
                 data_frame.columns, 
-                index=0
+                default=[data_frame.columns[0]]
             )
             target_col = st.selectbox(
                 "Colonne des variables à expliquer", 
                 data_frame.columns, 
                 index=len(data_frame.columns)-1
             )
+            group_col = st.selectbox(
+                "Regrouper par (une régression par groupe)",
+                [NO_GROUP, *data_frame.columns],
+                index=0,
+                key="reg_group"
+            )
             
             # Extract data
-            explicative_vars = data_frame[explicative_col].tolist()
-            target_vars = data_frame[target_col].tolist()
+            target_vars = data_frame[target_col].to_numpy()
 
             # Data preview
             st.markdown("**Aperçu des données :**")
 
-            
-            # Points clound
-            display_data_points_cloud_graphic(
-                X_data=explicative_vars, 
-                X_label=explicative_col,
-                Y_data=target_vars, 
-                Y_lable=target_col
-            )
+            # Points clound (simple regression only)
+            if len(explicative_cols) == 1:
+                explicative_col = explicative_cols[0]
+                explicative_vars = data_frame[explicative_col].to_numpy()
+
+                display_data_points_cloud_graphic(
+                    X_data=explicative_vars, 
+                    X_label=explicative_col,
+                    Y_data=target_vars, 
+                    Y_lable=target_col,
+                    max_points=int(max_points)
+                )
             
             # Table
             st.dataframe(data_frame, width="stretch")
@@ -132,7 +275,38 @@ def show():
         st.subheader("📊 Résultats")
         
         if compute_btn:
-            if uploaded_file is not None:
+            if uploaded_file is not None and not explicative_cols:
+                st.warning("⚠️ Veuillez choisir au moins une variable explicative")
+            elif uploaded_file is not None and group_col != NO_GROUP:
+                if len(explicative_cols) > 1:
+                    st.warning("⚠️ La régression par groupe n'utilise qu'une variable explicative")
+                else:
+                    try:
+                        # One simple regression per group
+                        groups_table = linear_regression_compute_grouped(
+                            group_keys=data_frame[group_col].to_numpy(),
+                            explicative_vars=data_frame[explicative_cols[0]].to_numpy(),
+                            tagert_vars=data_frame[target_col].to_numpy()
+                        )
+
+                        st.success(f"✅ {len(groups_table)} régressions calculées (une par groupe de « {group_col} ») !")
+                        st.dataframe(groups_table, width="stretch", hide_index=True)
+
+                    except Exception as e:
+                        st.error(f"❌ Erreur : {str(e)}")
+            elif uploaded_file is not None and len(explicative_cols) > 1:
+                try:
+                    # Several explanatory columns: one least squares fit
+                    result = linear_regression_compute_multiple(
+                        explicative_vars=data_frame[explicative_cols].to_numpy(),
+                        tagert_vars=data_frame[target_col].to_numpy()
+                    )
+
+                    display_multiple_regression_result(result, explicative_cols, target_col)
+
+                except Exception as e:
+                    st.error(f"❌ Erreur : {str(e)}")
+            elif uploaded_file is not None:
                 try:
                     # Calculate the linear model
                     result = linear_regression_compute(
@@ -165,13 +339,28 @@ def show():
                         else:
                             st.error("🔴 Faible corrélation")
 
+                    if resampling:
+                        display_confidence_intervals(
+                            result,
+                            bootstrap=linear_regression_bootstrap(
+                                explicative_vars, target_vars,
+                                n_resamples=int(n_resamples), confidence=confidence, seed=int(seed)
+                            ),
+                            permutation_test=linear_regression_permutation_test(
+                                explicative_vars, target_vars,
+                                n_permutations=int(n_resamples), seed=int(seed)
+                            ),
+                            confidence=confidence
+                        )
+
                     display_regressionline(
                         a=result["a"],
                         b=result["b"],
                         X_data=explicative_vars, 
                         X_label=explicative_col,
                         Y_data=target_vars, 
-                        Y_lable=target_col
+                        Y_lable=target_col,
+                        max_points=int(max_points)
                     )
                     
                 except Exception as e:
@@ -179,4 +368,7 @@ def show():
             else:
                 st.warning("⚠️ Veuillez charger un fichier CSV")
         else:
-            st.info("👈 Entrez les données et cliquez sur 'Calculer'")
\ No newline at end of file
+            st.info("👈 Entrez les données et cliquez sur 'Calculer'")
+
+    st.divider()
+    show_live_regression(explicative_vars, target_vars)
@@ -1,7 +1,175 @@
 import streamlit as st
 import numpy as np
+import pandas as pd
+import tempfile
+import os
 
-from core.linear_system import solve_linear_system
+from core.linear_system import (
+    solve_linear_system,
+    solve_linear_system_cached,
+    solve_linear_system_out_of_core,
+    solve_sparse_linear_system,
+    load_dense_matrix,
+    load_sparse_matrix,
+    load_vector,
+    ITERATIVE_METHODS,
+    PRECONDITIONERS
+)
+
+input_modes = [
+    "✍️ Saisie manuelle",
+    "📁 Fichier coordonnées (COO)",
+    "📦 Fichier binaire (.npy)"
+]
+
+def display_solution_table(solution: np.ndarray) -> None:
+    st.markdown("**Solution :**")
+    st.dataframe(
+        pd.DataFrame({"x": solution}, index=[f"x{i+1}" for i in range(len(solution))]),
+        width="stretch"
+    )
+
+def show_sparse_inputs() -> dict:
+    st.caption("Un triplet « ligne colonne valeur » par ligne (indices à partir de 0), ou un fichier Matrix Market (.mtx)")
+    matrix_a_file = st.file_uploader(
+        "Matrice A (creuse)",
+        type=["txt", "csv", "mtx"],
+        key="sparse_matrix_a"
+    )
+
+    st.caption("Une valeur par ligne")
+    vector_b_file = st.file_uploader(
+        "Vecteur b",
+        type=["txt", "csv"],
+        key="sparse_vector_b"
+    )
+
+    col_method, col_preconditioner = st.columns(2)
+    with col_method:
+        method = st.selectbox("Méthode itérative", ITERATIVE_METHODS, index=0)
+    with col_preconditioner:
+        preconditioner = st.selectbox(
+            "Préconditionneur",
+            PRECONDITIONERS,
+            index=1,
+            format_func=lambda x: "aucun" if x is None else x
+        )
+
+    col_tolerance, col_iterations = st.columns(2)
+    with col_tolerance:
+        tolerance = st.number_input("Tolérance", min_value=1e-16, max_value=1e-1, value=1e-8, format="%.1e")
+    with col_iterations:
+        max_iterations = st.number_input("Itérations max", min_value=1, value=1000, step=100)
+
+    return {
+        "matrix_a_file": matrix_a_file,
+        "vector_b_file": vector_b_file,
+        "method": method,
+        "preconditioner": preconditioner,
+        "tolerance": tolerance,
+        "max_iterations": int(max_iterations)
+    }
+
+def show_sparse_results(sparse_inputs: dict) -> None:
+    if sparse_inputs["matrix_a_file"] is None or sparse_inputs["vector_b_file"] is None:
+        st.warning("⚠️ Veuillez charger la matrice A et le vecteur b")
+        return
+
+    try:
+        a = load_sparse_matrix(sparse_inputs["matrix_a_file"])
+        b = load_vector(sparse_inputs["vector_b_file"])
+
+        result = solve_sparse_linear_system(
+            a, b,
+            method=sparse_inputs["method"],
+            preconditioner=sparse_inputs["preconditioner"],
+            tolerance=sparse_inputs["tolerance"],
+            max_iterations=sparse_inputs["max_iterations"]
+        )
+
+        if result["converged"]:
+            st.success(f"✅ Système résolu avec {result['method']} !")
+        else:
+            st.warning(f"⚠️ {result['method']} n'a pas convergé dans la limite d'itérations.")
+
+        col_size, col_iterations, col_residual = st.columns(3)
+        with col_size:
+            st.metric("Inconnues", f"{a.shape[0]} ({a.nnz} non nuls)")
+        with col_iterations:
+            st.metric("Itérations", result["iterations"])
+        with col_residual:
+            st.metric("Résidu relatif", f"{result['residual']:.2e}")
+
+        display_solution_table(result["solution"])
+
+    except Exception as e:
+        st.error(f"❌ Erreur lors de la résolution : {str(e)}")
+
+def show_binary_inputs() -> dict:
+    st.caption("Matrice A au format NumPy (.npy), lue par mappage mémoire")
+    matrix_a_file = st.file_uploader(
+        "Matrice A (.npy)",
+        type=["npy"],
+        key="binary_matrix_a"
+    )
+
+    st.caption("Vecteur b au format NumPy (.npy) ou une valeur par ligne")
+    vector_b_file = st.file_uploader(
+        "Vecteur b",
+        type=["npy", "txt", "csv"],
+        key="binary_vector_b"
+    )
+
+    out_of_core = st.checkbox(
+        "Factorisation hors mémoire (matrices plus grandes que la RAM)",
+        value=False,
+        key="binary_out_of_core"
+    )
+
+    return {
+        "matrix_a_file": matrix_a_file,
+        "vector_b_file": vector_b_file,
+        "out_of_core": out_of_core
+    }
+
+def show_binary_results(binary_inputs: dict) -> None:
+    if binary_inputs["matrix_a_file"] is None or binary_inputs["vector_b_file"] is None:
+        st.warning("⚠️ Veuillez charger la matrice A et le vecteur b")
+        return
+
+    try:
+        # Save temporary matrix file, so that it can be memory-mapped
+        with tempfile.NamedTemporaryFile(mode='wb', delete=False, suffix='.npy') as tmp_file:
+            tmp_file.write(binary_inputs["matrix_a_file"].getvalue())
+            tmp_path = tmp_file.name
+
+        a = load_dense_matrix(tmp_path)
+
+        vector_b_file = binary_inputs["vector_b_file"]
+        b = np.load(vector_b_file) if vector_b_file.name.endswith(".npy") else load_vector(vector_b_file)
+
+        if a.shape[0] != b.size:
+            st.error(f"❌ Erreur : La matrice A a {a.shape[0]} lignes mais le vecteur b a {b.size} éléments.")
+            return
+
+        # Resolve
+        if binary_inputs["out_of_core"]:
+            solution = solve_linear_system_out_of_core(a, b)
+        else:
+            solution = solve_linear_system_cached(a, b)
+
+        # Release the memory map and clear temporary file
+        del a
+        os.unlink(tmp_path)
+
+        if solution is None:
+            st.error("⚠️ La solution est indéterminée.")
+        else:
+            st.success("✅ Système résolu avec succès !")
+            display_solution_table(solution)
+
+    except Exception as e:
+        st.error(f"❌ Erreur lors de la résolution : {str(e)}")
 
 def show():
     st.header("📐 Résolution de Systèmes Linéaires")
@@ -11,27 +179,41 @@ def show():
     
     with col1:
         st.subheader("📥 Saisie des données")
-        
-        # Set A matrix
-        st.markdown("**Matrice A (coefficients)**")
-        st.caption("Entrez chaque ligne sur une nouvelle ligne, coefficients séparés par des espaces")
-        matrix_a_text = st.text_area(
-            "Matrice A",
-            value="2 1 -4\n3 3 -5\n4 5 -2",
-            height=150,
-            label_visibility="collapsed",
-            key="matrix_a"
-        )
-        
-        # Set vector b
-        st.markdown("**Vecteur b (résultats)**")
-        st.caption("Valeurs séparées par des virgules")
-        vector_b_text = st.text_input(
-            "Vecteur b",
-            value="6, 12, 10",
-            label_visibility="collapsed",
-            key="vector_b"
+
+        # Choise between manual or sparse coordinate file
+        input_mode = st.radio(
+            "Mode de saisie :",
+            input_modes,
+            horizontal=True
         )
+
+        if input_mode == input_modes[0]: # Manual input mode
+            # Set A matrix
+            st.markdown("**Matrice A (coefficients)**")
+            st.caption("Entrez chaque ligne sur une nouvelle ligne, coefficients séparés par des espaces")
+            matrix_a_text = st.text_area(
+                "Matrice A",
+                value="2 1 -4\n3 3 -5\n4 5 -2",
+                height=150,
+                label_visibility="collapsed",
+                key="matrix_a"
+            )
+
+            # Set vector b
+            st.markdown("**Vecteur b (résultats)**")
+            st.caption("Valeurs séparées par des virgules")
+            vector_b_text = st.text_input(
+                "Vecteur b",
+                value="6, 12, 10",
+                label_visibility="collapsed",
+                key="vector_b"
+            )
+
+        elif input_mode == input_modes[1]: # Sparse coordinate file
+            sparse_inputs = show_sparse_inputs()
+
+        else: # Memory-mapped binary file
+            binary_inputs = show_binary_inputs()
         
         # Boutons
         col_btn1, col_btn2 = st.columns(2)
@@ -46,6 +228,12 @@ def show():
         if clear_btn:
             st.info("Données effacées. Entrez de nouvelles valeurs.")
         
+        elif solve_btn and input_mode == input_modes[1]:
+            show_sparse_results(sparse_inputs)
+
+        elif solve_btn and input_mode == input_modes[2]:
+            show_binary_results(binary_inputs)
+
         elif solve_btn:
             try:
                 # Format A matrix
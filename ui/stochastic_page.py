@@ -1,9 +1,35 @@
 import streamlit as st
 import numpy as np
+import pandas as pd
 import matplotlib.pyplot as plt
 import graphviz
+import tempfile
+import os
 
-from core.stochastic_process import stochastic_process_simule_markov_chain, stochastic_process_simule_random_walk
+from core.stochastic_process import (
+    stochastic_process_simule_markov_chain,
+    stochastic_process_simule_markov_chain_batch,
+    stochastic_process_sample_random_walk,
+    stochastic_process_simule_random_walk_with_markov_chain,
+    stochastic_process_markov_chain_at_times,
+    stochastic_process_load_transition_matrix
+)
+from core.markov_analysis import markov_classify_states, markov_stationary_distribution, markov_absorption_analysis
+
+# Longest part of a random walk written out as a sequence
+MAX_SEQUENCE_STEPS = 200
+MAX_WALK_STEPS = 10_000_000
+MAX_MARKOV_PATHS = 1_000_000
+
+markov_sources = [
+    "✍️ Saisie manuelle",
+    "📁 Liste de transitions (CSV)"
+]
+
+# Above this number of states, per-state graphs and tables only show the most probable states
+MAX_DISPLAY_STATES = 30
+
+state_types_labels = {"transient": "Transitoire", "recurrent": "Récurrent", "absorbing": "Absorbant"}
 
 
 def display_markov_chain(
@@ -48,44 +74,44 @@ def display_markov_distributions_evolution_line_graph(
     
     st.pyplot(fig)
 
-def display_walk_evolution_resume(states: list[str], evolution: list[str]) -> None:
-    state_counts = {state: evolution.count(state) for state in states}
+def display_walk_evolution_resume(walk: dict) -> None:
+    counts = walk["counts"]
 
     col1, col2, col3 = st.columns(3)
     with col1:
-        st.metric("Total de pas", len(evolution))
+        st.metric("Total de pas", walk["codes"].size)
     with col2:
-        most_visited = max(state_counts, key=lambda k: state_counts.get(k, 0))
-        st.metric("État le plus visité", f"{most_visited} ({state_counts[most_visited]}x)")
+        most_visited = int(np.argmax(counts))
+        st.metric("État le plus visité", f"{walk['states'][most_visited]} ({counts[most_visited]}x)")
     with col3:
-        least_visited = min(state_counts, key=lambda k: state_counts.get(k, 0))
-        st.metric("État le moins visité", f"{least_visited} ({state_counts[least_visited]}x)")
+        least_visited = int(np.argmin(counts))
+        st.metric("État le moins visité", f"{walk['states'][least_visited]} ({counts[least_visited]}x)")
 
 
-def display_walk_evolution_sequence(evolution: list[str]) -> None:
-    sequence_text = " → ".join(evolution)
+def display_walk_evolution_sequence(walk: dict) -> None:
+    # Only the beginning of a long walk is written out
+    sequence_text = " → ".join(walk["states"][walk["codes"][:MAX_SEQUENCE_STEPS]])
+    if walk["codes"].size > MAX_SEQUENCE_STEPS:
+        sequence_text += f" → … ({walk['codes'].size} pas au total)"
     st.code(sequence_text, language="text")
 
-def display_walk_evolution_table_resume(states: list[str], evolution: list[str]) -> None:
-    state_counts = {state: evolution.count(state) for state in states}
+def display_walk_evolution_table_resume(walk: dict) -> None:
+    counts = walk["counts"]
     
     stats_data = {
-        "État": states,
-        "Occurrences": [state_counts[state] for state in states],
-        "Pourcentage": [f"{(state_counts[state]/len(evolution)*100):.2f}%" for state in states]
+        "État": walk["states"].tolist(),
+        "Occurrences": counts.tolist(),
+        "Pourcentage": [f"{percent:.2f}%" for percent in (counts / walk["codes"].size * 100).tolist()]
     }
     
     st.dataframe(stats_data, use_container_width=True)
 
-def display_walk_evolution_bar_graph(states: list[str], evolution: list[str]) -> None:
-    # Count occurrences of each state
-    state_counts = {state: evolution.count(state) for state in states}
-    
+def display_walk_evolution_bar_graph(walk: dict) -> None:
     # Display a bar graph of occurrences
     fig, ax = plt.subplots(figsize=(10, 5))
     
-    labels = states
-    counts = [state_counts[state] for state in labels]
+    labels = walk["states"].tolist()
+    counts = walk["counts"]
     colors = plt.get_cmap('Set3')(np.linspace(0, 1, len(labels)))
     bars = ax.bar(labels, counts, color=colors, alpha=0.8, edgecolor='black')
     
@@ -104,6 +130,84 @@ def display_walk_evolution_bar_graph(states: list[str], evolution: list[str]) ->
     
     st.pyplot(fig)
 
+def most_probable_states(distributions: np.ndarray) -> np.ndarray:
+    # Indices of the states worth displaying, in state order
+    if distributions.shape[-1] <= MAX_DISPLAY_STATES:
+        return np.arange(distributions.shape[-1])
+
+    peak = distributions.reshape(-1, distributions.shape[-1]).max(axis=0)
+    return np.sort(np.argpartition(peak, -MAX_DISPLAY_STATES)[-MAX_DISPLAY_STATES:])
+
+def display_top_states(states: list[str], distribution: np.ndarray) -> None:
+    shown = most_probable_states(distribution)
+    st.markdown(f"**Distribution finale ({shown.size} états les plus probables sur {len(states)})**")
+    st.dataframe(
+        pd.DataFrame({"Probabilité": distribution[shown].round(6)}, index=[states[i] for i in shown])
+            .sort_values("Probabilité", ascending=False),
+        use_container_width=True
+    )
+
+def display_markov_paths_statistics(states: list[str], simulation: dict) -> None:
+    st.markdown(f"**Trajectoires simulées (Monte Carlo, {simulation['occupancy_times'][-1]} pas)**")
+    if len(states) <= MAX_DISPLAY_STATES:
+        display_markov_distributions_evolution_line_graph(states, simulation["occupancy"])
+
+    hitting = pd.DataFrame({
+        "État": [states[i] for i in simulation["targets"]],
+        "Probabilité d'atteinte": simulation["hitting_probability"].round(4),
+        "Temps moyen d'atteinte": simulation["mean_hitting_time"].round(2)
+    })
+    if len(hitting) > MAX_DISPLAY_STATES:
+        hitting = hitting.nlargest(MAX_DISPLAY_STATES, "Probabilité d'atteinte")
+    if len(hitting):
+        st.dataframe(hitting, use_container_width=True)
+    else:
+        st.caption("ℹ️ Temps d'atteinte non suivis (trop d'états pour ce nombre de trajectoires)")
+
+    if simulation["absorbing_states"].size:
+        absorbing = ", ".join(states[i] for i in simulation["absorbing_states"])
+        col1, col2 = st.columns(2)
+        col1.metric(f"Absorption ({absorbing})", f"{simulation['absorption_probability'].sum():.2%}")
+        col2.metric(
+            "Temps moyen d'absorption",
+            "-" if simulation["mean_absorption_time"] is None else f"{simulation['mean_absorption_time']:.2f}"
+        )
+
+def display_markov_analysis(states: list[str], transition_matrix: list[list[float]]) -> None:
+    st.markdown("**Analyse de la chaîne (exacte)**")
+    classification = markov_classify_states(transition_matrix)
+
+    # The stationary distribution only exists (uniquely) with a single closed class
+    if len(classification["closed_classes"]) == 1:
+        stationary = markov_stationary_distribution(transition_matrix).round(4).tolist()
+    else:
+        stationary = ["-"] * len(states)
+
+    st.dataframe(
+        {
+            "État": states,
+            "Classe": classification["classes"].tolist(),
+            "Type": [state_types_labels[state_type] for state_type in classification["types"]],
+            "Distribution stationnaire": stationary
+        },
+        use_container_width=True
+    )
+
+    absorption = markov_absorption_analysis(transition_matrix)
+    if absorption["transient_states"].size:
+        table = pd.DataFrame(
+            absorption["absorption_probabilities"].round(4),
+            index=[states[i] for i in absorption["transient_states"]],
+            columns=["P(→ " + ", ".join(states[i] for i in closed_class) + ")" for closed_class in absorption["absorbing_classes"]]
+        )
+        table["Pas moyens avant absorption"] = absorption["expected_steps"].round(2)
+
+        st.markdown("**Absorption depuis les états transitoires**")
+        st.dataframe(table, use_container_width=True)
+
+def parse_times(times_text: str) -> list[int]:
+    return [int(float(x.strip())) for x in times_text.split(",") if x.strip()]
+
 def parse_states(states_text: str) -> list[str]:
     return [state.strip() for state in states_text.split(",")]
 
@@ -136,33 +240,58 @@ def show():
             clear_btn = st.button("🗑️ Effacer", use_container_width=True)
 
         if process_type == "Chaîne de Markov":
-            st.markdown("**États**")
-            st.caption("Noms des états séparés par des virgules")
-            markorv_states_input = st.text_input(
-                "États", 
-                value="A, I, P", 
-                label_visibility="collapsed", 
-                key="markov_states"
+            markov_source = st.radio(
+                "Source de la chaîne :",
+                markov_sources,
+                horizontal=True,
+                key="markov_source"
             )
 
-            st.markdown("**Matrice de transition d'état**")
-            st.caption("Une ligne par état, probabilités séparées par des espaces")
-            transition_matrix_input = st.text_area(
-                "Matrice", 
-                value="0.6 0.3 0.1\n0.4 0.4 0.2\n0.0 0.0 1.0", 
-                height=100, 
-                label_visibility="collapsed", 
-                key="markov_matrix"
-            )
+            if markov_source == markov_sources[0]: # Manual input
+                st.markdown("**États**")
+                st.caption("Noms des états séparés par des virgules")
+                markorv_states_input = st.text_input(
+                    "États", 
+                    value="A, I, P", 
+                    label_visibility="collapsed", 
+                    key="markov_states"
+                )
 
-            st.markdown("**Distribution initiale**")
-            st.caption("Probabilités séparées par des virgules")
-            initial_distribution_input = st.text_input(
-                "État initial", 
-                value="0.7, 0.2, 0.1", 
-                label_visibility="collapsed", 
-                key="markov_initial"
-            )
+                st.markdown("**Matrice de transition d'état**")
+                st.caption("Une ligne par état, probabilités séparées par des espaces")
+                transition_matrix_input = st.text_area(
+                    "Matrice", 
+                    value="0.6 0.3 0.1\n0.4 0.4 0.2\n0.0 0.0 1.0", 
+                    height=100, 
+                    label_visibility="collapsed", 
+                    key="markov_matrix"
+                )
+
+                st.markdown("**Distribution initiale**")
+                st.caption("Probabilités séparées par des virgules")
+                initial_distribution_input = st.text_input(
+                    "État initial", 
+                    value="0.7, 0.2, 0.1", 
+                    label_visibility="collapsed", 
+                    key="markov_initial"
+                )
+
+            else: # Edge list (sparse matrix)
+                edges_file = st.file_uploader(
+                    "Choisissez un fichier de transitions",
+                    type=['csv'],
+                    help="Colonnes : from, to, probability (une ligne par transition)",
+                    key="markov_edges"
+                )
+
+                st.markdown("**État initial**")
+                st.caption("Nom de l'état de départ (le premier état si vide)")
+                initial_state_input = st.text_input(
+                    "État de départ",
+                    value="",
+                    label_visibility="collapsed",
+                    key="markov_initial_state"
+                )
 
             target_time_input = st.number_input(
                 "Temps cible", 
@@ -172,16 +301,66 @@ def show():
                 key="markov_steps"
             )
 
+            st.markdown("**Temps d'observation (optionnel)**")
+            st.caption("Temps séparés par des virgules, sans limite (ex. 1000, 1e9)")
+            observation_times_input = st.text_input(
+                "Temps d'observation",
+                value="",
+                label_visibility="collapsed",
+                key="markov_times"
+            )
+
+            simulate_paths = st.checkbox("🎯 Simuler des trajectoires (Monte Carlo)", value=False, key="markov_paths")
+            n_paths_input = st.number_input(
+                "Nombre de trajectoires",
+                min_value=1,
+                max_value=MAX_MARKOV_PATHS,
+                value=10_000,
+                step=1000,
+                key="markov_n_paths",
+                disabled=not simulate_paths
+            )
+
             st.subheader("**Représentation de la chaîne de Markov**")
+            markov_states = None
             try:
-                markov_states = parse_states(markorv_states_input)
-                transition_matrix = parse_transition_matrix(transition_matrix_input)
-                initial_distribution = parse_distribution(initial_distribution_input)
+                if markov_source == markov_sources[0]:
+                    markov_states = parse_states(markorv_states_input)
+                    transition_matrix = parse_transition_matrix(transition_matrix_input)
+                    initial_distribution = parse_distribution(initial_distribution_input)
+
+                    if len(markov_states) != len(transition_matrix):
+                        st.error("❌ Le nombre d'états doit correspondre à la taille de la matrice de transition.")
+                        markov_states = None
+                    else:
+                        display_markov_chain(markov_states, transition_matrix)
+
+                elif edges_file is not None:
+                    # Save temporary edges file
+                    with tempfile.NamedTemporaryFile(mode='wb', delete=False, suffix='.csv') as tmp_file:
+                        tmp_file.write(edges_file.getvalue())
+                        tmp_path = tmp_file.name
+
+                    chain = stochastic_process_load_transition_matrix(tmp_path)
+                    os.unlink(tmp_path)
+
+                    markov_states = [str(state) for state in chain["states"]]
+                    transition_matrix = chain["transition_matrix"]
+
+                    # The chain starts from a single state
+                    initial_state = initial_state_input.strip() or markov_states[0]
+                    if initial_state not in markov_states:
+                        raise ValueError(f"État initial inconnu : {initial_state}")
+                    initial_distribution = np.zeros(len(markov_states))
+                    initial_distribution[markov_states.index(initial_state)] = 1.0
+
+                    if len(markov_states) <= MAX_DISPLAY_STATES:
+                        display_markov_chain(markov_states, transition_matrix.toarray())
+                    else:
+                        st.caption(f"ℹ️ {len(markov_states)} états, {transition_matrix.nnz} transitions (matrice creuse)")
 
-                if len(markov_states) != len(transition_matrix):
-                    st.error("❌ Le nombre d'états doit correspondre à la taille de la matrice de transition.")
                 else:
-                    display_markov_chain(markov_states, transition_matrix)
+                    st.warning("⚠️ Veuillez charger un fichier de transitions")
             except Exception as e:
                 st.error(f"❌ Erreur dans les paramètres : {str(e)}")
 
@@ -203,7 +382,7 @@ def show():
             walk_steps_input = st.number_input(
                 "Nombre de pas", 
                 min_value=1, 
-                max_value=1000, 
+                max_value=MAX_WALK_STEPS, 
                 value=5, 
                 key="walk_steps"
             )
@@ -221,27 +400,80 @@ def show():
     with col2:
         st.subheader("📊 Résultats")
 
-        if process_type == "Chaîne de Markov" and simulate_btn:
+        if process_type == "Chaîne de Markov" and simulate_btn and markov_states is None:
+            # No chain to simulate: missing transitions file or invalid parameters
+            if markov_source == markov_sources[0]:
+                st.warning("⚠️ Veuillez corriger les paramètres de la chaîne")
+            else:
+                st.warning("⚠️ Veuillez charger un fichier de transitions")
+
+        elif process_type == "Chaîne de Markov" and simulate_btn:
             try:
-                distributions_evolution: list[list[float]] = stochastic_process_simule_markov_chain(
-                    transition_matrix=transition_matrix,
-                    initial_distribution=initial_distribution,
-                    target_time=target_time_input
-                )
+                if len(markov_states) <= MAX_DISPLAY_STATES:
+                    distributions_evolution: np.ndarray = stochastic_process_simule_markov_chain(
+                        transition_matrix=transition_matrix,
+                        initial_distribution=initial_distribution,
+                        target_time=target_time_input
+                    )
+                else:
+                    # Only the final distribution of a large chain is displayed: the evolution is not kept
+                    final_distribution = stochastic_process_simule_markov_chain_batch(
+                        transition_matrix=transition_matrix,
+                        initial_distributions=[initial_distribution],
+                        target_time=target_time_input,
+                        checkpoints=[target_time_input]
+                    )[0, 0]
 
                 st.success("✅ Simulation terminée !")
 
-                display_markov_distributions_evolution_line_graph(markov_states, distributions_evolution)
+                if len(markov_states) <= MAX_DISPLAY_STATES:
+                    display_markov_analysis(markov_states, transition_matrix)
 
-                for i, distribution in enumerate(distributions_evolution):
-                    st.metric(f"Distribution (t = {i})", str([round(x, 4) for x in distribution]))
+                    display_markov_distributions_evolution_line_graph(markov_states, distributions_evolution)
+
+                    for i, distribution in enumerate(distributions_evolution):
+                        st.metric(f"Distribution (t = {i})", str(distribution.round(4).tolist()))
+                else:
+                    display_top_states(markov_states, final_distribution)
+
+                # Far horizons: only the requested times are computed
+                observation_times = parse_times(observation_times_input)
+                if observation_times:
+                    observations = stochastic_process_markov_chain_at_times(
+                        transition_matrix=transition_matrix,
+                        initial_distribution=initial_distribution,
+                        times=observation_times,
+                        tolerance=1e-12
+                    )
+
+                    shown = most_probable_states(observations["distributions"])
+                    st.markdown("**Distribution aux temps d'observation**")
+                    st.dataframe(
+                        pd.DataFrame(
+                            observations["distributions"][:, shown],
+                            index=pd.Index(observations["times"], name="t"),
+                            columns=[markov_states[i] for i in shown]
+                        ).round(6),
+                        use_container_width=True
+                    )
+                    if observations["converged_at"] is not None:
+                        st.caption(f"ℹ️ Distribution stationnaire atteinte dès t = {observations['converged_at']}")
+
+                if simulate_paths:
+                    simulation = stochastic_process_simule_random_walk_with_markov_chain(
+                        transition_matrix=transition_matrix,
+                        initial_distribution=initial_distribution,
+                        step=target_time_input,
+                        n_paths=n_paths_input
+                    )
+                    display_markov_paths_statistics(markov_states, simulation)
             
             except Exception as e:
                 st.error(f"❌ Erreur : {str(e)}")
 
         elif process_type == "Marche aléatoire" and simulate_btn:
             try:
-                walk_evolution: list[str] = stochastic_process_simule_random_walk(
+                walk = stochastic_process_sample_random_walk(
                     states=walk_states,
                     probabilities=walk_states_probility,
                     step=walk_steps_input
@@ -250,15 +482,15 @@ def show():
                 st.success("✅ Simulation terminée !")
 
                 st.markdown("**Marches aléatoires**")
-                display_walk_evolution_resume(walk_states, walk_evolution)
+                display_walk_evolution_resume(walk)
 
-                st.markdown("**Séquence complète de la marche aléatoire**")
-                display_walk_evolution_sequence(walk_evolution)
+                st.markdown("**Séquence de la marche aléatoire**")
+                display_walk_evolution_sequence(walk)
 
-                display_walk_evolution_bar_graph(walk_states, walk_evolution)
+                display_walk_evolution_bar_graph(walk)
                 
                 st.markdown("**Statistiques détaillées**")
-                display_walk_evolution_table_resume(walk_states, walk_evolution)
+                display_walk_evolution_table_resume(walk)
 
             except Exception as e:
                 st.error(f"❌ Erreur : {str(e)}")